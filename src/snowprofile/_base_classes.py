@@ -5,7 +5,10 @@ Base Classes and field validators that are used in the snowprofile, classes, pro
 stability_tests packages.
 """
 
+import copy
+import dataclasses
 import datetime
+import functools
 import typing
 import logging
 import re
@@ -16,12 +19,32 @@ import pydantic.json_schema
 import pandas as pd
 import numpy as np
 
+from snowprofile._constants import QUALITY_FLAGS
 
-class AdditionalData(pydantic.BaseModel):
+
+@dataclasses.dataclass(slots=True)
+class AdditionalData:
+    """
+    Container for additional data (CAAML customData).
+
+    A plain dataclass rather than a pydantic model: it is a trivial wrapper and
+    pydantic still validates it (from a dict or an instance) when used as a field.
+    """
     data: typing.Any
     origin: typing.Optional[str] = None
 
 
+_UTC = datetime.timezone.utc
+
+# On python <= 3.10, datetime.fromisoformat have troubles with decimal seconds as
+# prodived by some other libraries such as NiViz. This regex is used to get rid of this
+# unnecessary precision (compiled once, None if not needed).
+if sys.version_info.major == 3 and sys.version_info.minor < 11:
+    _re_decimal_seconds = re.compile(r'([0-9]{4}-[0-9]{2}-[0-9]{2}[ T]?[0-9]{2}:[0-9]{2}:[0-9]{2})\.[0-9]*')
+else:
+    _re_decimal_seconds = None
+
+
 def force_utc(value: str | datetime.datetime | None) -> typing.Optional[datetime.datetime]:
     """
     Parse to a datetime object and force the tzinfo to be defined in a python datetime object.
@@ -31,16 +54,12 @@ def force_utc(value: str | datetime.datetime | None) -> typing.Optional[datetime
     if value is None:
         return None
     if isinstance(value, str):
-        if sys.version_info.major == 3 and sys.version_info.minor < 11:
-            # On python <= 3.10, datetime.fromisoformat have troubles with decimal seconds as
-            # prodived by some other libraries such as NiViz. Get rid of this unnecessary precision.
-            m = re.match(r'([0-9]{4}-[0-9]{2}-[0-9]{2}[ T]?[0-9]{2}:[0-9]{2}:[0-9]{2})\.[0-9]*', value)
+        if _re_decimal_seconds is not None:
+            m = _re_decimal_seconds.match(value)
             if m is not None:
                 value = m.group(1) + value[m.span(0)[1]:]
         value = datetime.datetime.fromisoformat(value)
-    if value.tzinfo is None:
-        return value.replace(tzinfo=datetime.timezone.utc)
-    return value
+    return value if value.tzinfo is not None else value.replace(tzinfo=_UTC)
 
 
 def serialize_datetime(value: typing.Optional[datetime.datetime]) -> typing.Optional[str]:
@@ -64,10 +83,7 @@ def force_utc_tuple(value: tuple) -> tuple:
     """
     if value is None:
         return (None, None)
-    r = []
-    for i in range(len(value)):
-        r.append(force_utc(value[i]))
-    return tuple(value)
+    return tuple(force_utc(v) for v in value)
 
 
 def serialize_datetime_tuple(value) -> typing.Optional[typing.List[typing.Optional[str]]]:
@@ -88,6 +104,21 @@ datetime_tuple_with_tz = typing.Annotated[typing.Tuple[typing.Optional[datetime.
                                               serialize_datetime_tuple,
                                               return_type=typing.Optional[typing.List[typing.Optional[str]]])]
 
+quality_flag = typing.Literal[tuple(QUALITY_FLAGS)]
+
+
+_PANDAS_GE_3 = int(pd.__version__.split('.')[0]) >= 3
+
+
+def _copy_on_write() -> bool:
+    """
+    Whether pandas copy-on-write mode is active (always the case with pandas >= 3).
+
+    With copy-on-write, a shallow copy of a DataFrame is enough to protect the original
+    data from later modifications: the data is only copied when actually modified.
+    """
+    return _PANDAS_GE_3 or pd.options.mode.copy_on_write is True
+
 
 def get_dataframe_checker(_mode='Layer', **kwargs):
     """
@@ -105,119 +136,133 @@ def get_dataframe_checker(_mode='Layer', **kwargs):
             - nan_allowed: for numeric types, allow nan or not (default is False)
             - values: the list of accepted values
     """
+    # Constants that only depend on the data model: computed once when building the checker
+    if _mode == 'Layer':
+        two_of_three = frozenset(['top_height', 'bottom_height', 'thickness'])
+        accepted_columns_min = frozenset()
+        accepted_columns_max = two_of_three
+        height_keys = ['top_height', 'bottom_height', 'thickness']
+    elif _mode == "Spectral":
+        accepted_columns_min = frozenset(['min_wavelength', 'max_wavelength'])
+        accepted_columns_max = accepted_columns_min
+        height_keys = ['min_wavelength', 'max_wavelength']
+    elif _mode == 'Point':
+        accepted_columns_min = frozenset(['height'])
+        accepted_columns_max = accepted_columns_min
+        height_keys = ['height']
+    elif _mode == 'None':
+        accepted_columns_min = frozenset()
+        accepted_columns_max = frozenset()
+        height_keys = []
+    else:
+        raise ValueError(f'Mode {_mode} unknown. The data model is ill-defined.')
+
+    columns_min = []
+    for k, v in kwargs.items():
+        if 'optional' in v and v['optional']:
+            continue
+        else:
+            columns_min.append(k)
+    columns_min = frozenset(columns_min) | accepted_columns_min
+    columns_max = frozenset(kwargs.keys()) | accepted_columns_max
+
+    warn_above_10m = _mode in ['Point', 'Layer']
+
+    # Column constraints, as fixed-shape tuples (None when the constraint is not defined):
+    # (key, translate, type, min, max, nan_allowed, values)
+    column_specs = []
+    for key, d in kwargs.items():
+        column_specs.append((key, d.get('translate'), d.get('type', 'float'), d.get('min'), d.get('max'),
+                             d.get('nan_allowed', False), frozenset(d['values']) if 'values' in d else None))
+
     def check_dataframe(value, cls=None):
         # Check type -> ensure we have a pandas DataFrame
         if isinstance(value, dict):
             value = pd.DataFrame(value)
         elif isinstance(value, pd.DataFrame):
-            value = value.copy()
+            value = value.copy(deep=not _copy_on_write())
         else:
             raise ValueError('data key should be a pandas DataFrame or a python dictionnary.')
 
         # Check columns
-        columns = set(value.columns)
+        columns = frozenset(value.columns)
         if _mode == 'Layer':
-            two_of_three = set(['top_height', 'bottom_height', 'thickness'])
-            if len(columns.intersection(two_of_three)) == 3:
+            n_height_columns = len(columns & two_of_three)
+            if n_height_columns == 3:
                 if not (value['top_height'] - value['thickness'] == value['bottom_height']).all():
                     raise ValueError('Provided top_height, bottom_height and thickness that are inconsistent.')
-            elif len(columns.intersection(two_of_three)) != 2 and columns != ('top_height'):
+            elif n_height_columns != 2 and columns != ('top_height'):
                 raise ValueError(f'Should have 2 of three in {", ".join(two_of_three)}.')
-            accepted_columns_min = set([])
-            accepted_columns_max = set(['top_height', 'bottom_height', 'thickness'])
-        elif _mode == "Spectral":
-            accepted_columns_min = set(['min_wavelength', 'max_wavelength'])
-            accepted_columns_max = accepted_columns_min
-        elif _mode == 'Point':
-            accepted_columns_min = set(['height'])
-            accepted_columns_max = set(['height'])
-        elif _mode == 'None':
-            accepted_columns_min = set()
-            accepted_columns_max = set()
-        else:
-            raise ValueError(f'Mode {_mode} unknown. The data model is ill-defined.')
 
-        columns_min = []
-        for k, v in kwargs.items():
-            if 'optional' in v and v['optional']:
-                continue
-            else:
-                columns_min.append(k)
-        columns_min = set(columns_min) | accepted_columns_min
-        columns_max = set(kwargs.keys()) | accepted_columns_max
         if not columns.issuperset(columns_min):
             raise ValueError(f'The data should contain at least the following columns: {", ".join(columns_min)}.')
         if not columns.issubset(columns_max):
             raise ValueError(f'The data should contain at most the following columns: {", ".join(columns_max)}.')
 
         # Depths processing
-        # - Ensure types
-        if _mode == 'Layer':
-            height_keys = ['top_height', 'bottom_height', 'thickness']
-        elif _mode == "Point":
-            height_keys = ['height']
-        elif _mode == "Spectral":
-            height_keys = ['min_wavelength', 'max_wavelength']
-        else:
-            height_keys = []
-        for key in height_keys:
-            if key in columns:
-                value[key] = value[key].astype('float')
+        # - Ensure types (one cast for all height columns)
+        present_height_keys = [key for key in height_keys if key in columns]
+        if len(present_height_keys) > 0:
+            value[present_height_keys] = value[present_height_keys].astype('float')
         # - Completion of columns to ensure that top_height, bottom_height an dthickess are defined and coherent
-        if _mode == 'Layer':
+        if _mode == 'Layer' and n_height_columns == 2:
             # TODO: Reconstruct thickness from top_depth or bottom_depth if there is nan inside
             # or if only top_height is provided
             # (thickness is optional in a CAAML file)
-            if 'top_height' not in columns:
-                value['top_height'] = value['bottom_height'] + value['thickness']
-            if 'bottom_height' not in columns:
-                value['bottom_height'] = value['top_height'] - value['thickness']
-            if 'thickness' not in columns:
-                value['thickness'] = value['top_height'] - value['bottom_height']
+            # Exactly one column is missing. Computed on numpy arrays (no index alignment needed).
+            missing = next(iter(two_of_three - columns))
+            if missing == 'top_height':
+                value['top_height'] = value['bottom_height'].to_numpy() + value['thickness'].to_numpy()
+            elif missing == 'bottom_height':
+                value['bottom_height'] = value['top_height'].to_numpy() - value['thickness'].to_numpy()
+            else:
+                value['thickness'] = value['top_height'].to_numpy() - value['bottom_height'].to_numpy()
         # - Ensure reasonnable values and no nan
-        for key in height_keys:
-            if pd.isna(value[key]).any():
-                raise ValueError(f'Nan values are not allowed in {key} field')
-            # For CAAML format we need to accept negative height values
-            # if value[key].min() < 0:
-            #     raise ValueError(f'Negative values for {key} is not accepted.')
-            if _mode in ['Point', 'Layer'] and value[key].max() > 10:
-                logging.warning(f'Values above 10m for {key}. Please check your data !')
+        #   (all height columns are checked at once on a single numpy array, with a single
+        #   reduction: the maximum is nan if and only if there is a nan in the column)
+        if len(height_keys) > 0:
+            heights = value[height_keys].to_numpy(dtype='float')
+            heights_max = np.max(heights, axis=0, initial=-np.inf)
+            for key, key_max in zip(height_keys, heights_max):
+                if np.isnan(key_max):
+                    raise ValueError(f'Nan values are not allowed in {key} field')
+                # For CAAML format we need to accept negative height values
+                # if value[key].min() < 0:
+                #     raise ValueError(f'Negative values for {key} is not accepted.')
+                if warn_above_10m and key_max > 10:
+                    logging.warning('Values above 10m for %s. Please check your data !', key)
 
         # Check other data
-        for key, d in kwargs.items():
+        for key, translate, _type, _min, _max, nan_allowed, values in column_specs:
             if key not in value.columns:
                 continue
             # Replace values if needed
-            if 'translate' in d:
-                value[key] = value[key].replace(d['translate'])
+            if translate is not None:
+                value[key] = value[key].replace(translate)
             # Check type
-            _type = d['type'] if 'type' in d else 'float'
-            value[key] = value[key].astype(_type)
+            column = value[key].astype(_type)
+            value[key] = column
             # Check min/max and nan presence for numeric types
-            if np.issubdtype(value[key].dtype, np.number):
-                # Check min/max
-                if pd.isna(value[key].min()):
-                    logging.warning(f'Data from key {key} is empty !')
-                if 'min' in d:
-                    _min = d['min']
-                    if not pd.isna(value[key].min()) and value[key].min() < _min:
+            if np.issubdtype(column.dtype, np.number):
+                # Check min/max (each reduction is computed only once)
+                column_min = column.min()
+                if pd.isna(column_min):
+                    logging.warning('Data from key %s is empty !', key)
+                else:
+                    if _min is not None and column_min < _min:
                         raise ValueError(f'Data from key {key} has unaccepted values (below {_min}).')
-                if 'max' in d:
-                    _max = d['max']
-                    if not pd.isna(value[key].max()) and value[key].max() > _max:
+                    if _max is not None and column.max() > _max:
                         raise ValueError(f'Data from key {key} has unaccepted values (above {_max}).')
                 # Check nan presence
-                nan_allowed = d['nan_allowed'] if 'nan_allowed' in d else False
-                if not nan_allowed and pd.isna(value[key]).any():
+                if not nan_allowed and column.hasnans:
                     raise ValueError(f'Nan values are not allowed in {key} field')
             # Check fixed allowed values if needed
-            if 'values' in d:
-                if not set(value[key].values).issubset(set(d['values'])):
-                    raise ValueError(f'Unauthorized value for key {key}')
+            if values is not None and not column.isin(values).all():
+                raise ValueError(f'Unauthorized value for key {key}')
 
-        if len(height_keys) > 0:
-            value = value.sort_values(height_keys[0], ascending=False)
+        # Sort data by decreasing height (no sort needed if already sorted, which is the usual case)
+        if len(height_keys) > 0 and not value[height_keys[0]].is_monotonic_decreasing:
+            value = value.sort_values(height_keys[0], ascending=False, kind='stable')
 
         return value
 
@@ -233,19 +278,40 @@ class BaseData:
     """
     _data = typing.Optional[pd.DataFrame]
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_checker(cls):
+        """
+        Get the data checker of the class.
+
+        The checker only depends on the ``_data_config`` of the class, it is hence
+        built once per class and reused for all instances.
+        """
+        return get_dataframe_checker(**cls._data_config)
+
     @property
     def data(self) -> typing.Optional[pd.DataFrame]:
         """
         The profile data in the form of a Pandas Dataframe
         """
         if self._data is not None:
-            return self._data.copy()
+            return self._data.copy(deep=not _copy_on_write())
         else:
             return None
 
+    @property
+    def data_view(self) -> typing.Optional[pd.DataFrame]:
+        """
+        The profile data in the form of a Pandas Dataframe, without copy.
+
+        To be used for read-only access (plots, serialization): the returned
+        DataFrame must not be modified.
+        """
+        return self._data
+
     @data.setter
     def data(self, value):
-        checker = get_dataframe_checker(**self._data_config)
+        checker = self._get_checker()
         self._data = checker(value)
 
     @data.deleter
@@ -284,6 +350,10 @@ class BaseProfile(pydantic.BaseModel, BaseData):
         extra='forbid',
         arbitrary_types_allowed=True)
 
+    # Data model, defined by each profile class (see get_dataframe_checker).
+    # Declared as a class variable so that pydantic does not copy it for each instance.
+    _data_config: typing.ClassVar[dict] = {}
+
     id: typing.Optional[str] = pydantic.Field(
         None,
         description="Unique identifier of the profile [A-Za-z0-9-]")
@@ -317,7 +387,7 @@ class BaseProfile(pydantic.BaseModel, BaseData):
 
     def __init__(self, data=None, data_dict=None, **kwargs):
         super().__init__(**kwargs)
-        checker = get_dataframe_checker(**self._data_config)
+        checker = self._get_checker()
         if data is not None:
             self._data = checker(data)
         elif data_dict is not None:
@@ -330,8 +400,7 @@ class BaseProfile2(BaseProfile):
     """
     Base class for all profiles except stratigraphy
     """
-    quality_of_measurement: typing.Optional[typing.Literal[
-        'Good', 'Uncertain', 'Low', 'Bad']] = pydantic.Field(
+    quality_of_measurement: typing.Optional[quality_flag] = pydantic.Field(
             None,
             description="Quality flag of the entire profile. See :ref:`uncertainty` for details.")
     uncertainty_of_measurement: typing.Optional[float] = pydantic.Field(
@@ -426,3 +495,49 @@ class BaseMergeable:
             logging.warning(f'Merge: Could not compare values of {self.__class__.__name__}.{attr_name}. '
                             'Possible data loss (not merged).')
             return
+
+
+def _revalidate_value(value):
+    """
+    Copy a field value for revalidation, validating again the nested pydantic models.
+
+    Nested model instances are otherwise accepted as they are by pydantic, and
+    containers would be shared with the original object.
+    """
+    if isinstance(value, BaseRevalidatable):
+        return value.revalidate()
+    elif isinstance(value, pydantic.BaseModel):
+        fields = {key: _revalidate_value(v) for key, v in value}
+        if isinstance(value, BaseData):
+            fields['data'] = value.__dict__.get('_data')
+        return type(value).model_validate(fields)
+    elif isinstance(value, list):
+        return [_revalidate_value(v) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(_revalidate_value(v) for v in value)
+    elif isinstance(value, dict):
+        return {key: _revalidate_value(v) for key, v in value.items()}
+    elif dataclasses.is_dataclass(value):
+        return copy.deepcopy(value)
+    return value
+
+
+class BaseRevalidatable:
+    """
+    Implement a revalidate method for the pydantic data class.
+    """
+    def revalidate(self):
+        """
+        Validate again all the fields of the object, including nested objects.
+
+        Useful after in-place modifications that bypass assignment validation
+        (e.g. appending to a list field) or for objects built with ``model_construct``.
+
+        The object itself is not modified: the validated (and possibly normalized)
+        values are returned as a new object, to be used in place of the current one.
+        It shares no nested object, list or dict with the current one.
+
+        :returns: A new validated object of the same type
+        :raises pydantic.ValidationError: If a field is not valid
+        """
+        return type(self).model_validate({key: _revalidate_value(value) for key, value in self})
@@ -19,6 +19,36 @@ cloudiness_attribution = {
 
 QUALITY_FLAGS = ['Good', 'Uncertain', 'Low', 'Bad']
 
+COUNTRY_CODES = frozenset([
+    "AD", "AE", "AF", "AG", "AL", "AM", "AO", "AR", "AT", "AU",
+    "AZ", "BA", "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ",
+    "BN", "BO", "BQ", "BR", "BS", "BT", "BW", "BY", "BZ", "CA",
+    "CD", "CF", "CG", "CH", "CI", "CL", "CM", "CN", "CO", "CR",
+    "CU", "CV", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO", "DZ",
+    "EC", "EE", "EG", "ER", "ES", "ET", "FI", "FJ", "FM", "FR",
+    "GA", "GB", "GD", "GE", "GH", "GL", "GM", "GN", "GQ", "GR",
+    "GT", "GW", "GY", "HN", "HR", "HT", "HU", "ID", "IE", "IL",
+    "IN", "IQ", "IR", "IS", "IT", "JM", "JO", "JP", "KE", "KG",
+    "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KZ", "LA", "LB",
+    "LC", "LI", "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA",
+    "MC", "MD", "ME", "MG", "MH", "MK", "ML", "MM", "MN", "MR",
+    "MT", "MU", "MV", "MW", "MX", "MY", "MZ", "NA", "NE", "NG",
+    "NI", "NL", "NO", "NP", "NR", "NZ", "OM", "PA", "PE", "PG",
+    "PH", "PK", "PL", "PS", "PT", "PW", "PY", "QA", "RO", "RS",
+    "RU", "RW", "SA", "SB", "SC", "SD", "SE", "SG", "SH", "SI",
+    "SK", "SL", "SM", "SN", "SO", "SR", "SS", "ST", "SV", "SY",
+    "SZ", "TD", "TG", "TH", "TJ", "TL", "TM", "TN", "TO", "TR",
+    "TT", "TV", "TW", "TZ", "UA", "UG", "UM", "US", "UY", "UZ",
+    "VC", "VE", "VN", "VU", "WF", "WS", "YE", "ZA", "ZM", "ZW"])
+""" Accepted country codes (ISO 3166 alpha-2) """
+
+PRECIPITATION_CODES = frozenset([
+    "-DZ", "DZ", "+DZ", "-RA", "RA", "+RA", "-SN", "SN", "+SN",
+    "-SG", "SG", "+SG", "-IC", "IC", "+IC", "-PE", "PE", "+PE",
+    "-GR", "GR", "+GR", "-GS", "GS", "+GS",
+    "UP", "Nil", "RASN", "FZRA"])
+""" Accepted precipitation codes (METAR) """
+
 GRAIN_SHAPES = ["PP", "PPco", "PPnd", "PPpl", "PPsd", "PPir", "PPgp", "PPhl", "PPip", "PPrm",
                 "MM", "MMrp", "MMci",
                 "DF", "DFdc", "DFbk",
@@ -2,12 +2,16 @@
 
 import typing
 import datetime
+import functools
+import sys
 
 import pydantic
+from annotated_types import Ge, Gt, Le, Lt
 
-from snowprofile._constants import cloudiness_attribution, QUALITY_FLAGS
-from snowprofile._base_classes import AdditionalData, BaseData, BaseMergeable, \
-    datetime_with_tz, datetime_tuple_with_tz, get_dataframe_checker
+from snowprofile._constants import cloudiness_attribution, QUALITY_FLAGS, COUNTRY_CODES, \
+    PRECIPITATION_CODES
+from snowprofile._base_classes import AdditionalData, BaseData, BaseMergeable, BaseRevalidatable, \
+    datetime_with_tz, datetime_tuple_with_tz, quality_flag
 from snowprofile._utils import get_config
 
 __all__ = ['Person', 'Time', 'Observer', 'Location', 'Weather', 'SurfaceConditions',
@@ -15,53 +19,73 @@ __all__ = ['Person', 'Time', 'Observer', 'Location', 'Weather', 'SurfaceConditio
 
 conf = get_config()
 
+# Model configuration shared by all the classes of this module
+_STRICT_CONFIG = pydantic.ConfigDict(
+    validate_assignment=True,
+    extra='forbid',
+    defer_build=True)
+_STRICT_CONFIG_ARB = pydantic.ConfigDict(
+    **_STRICT_CONFIG,
+    arbitrary_types_allowed=True)
+
+# cloudiness_attribution as a tuple indexed by octas + 1 (octas from -1 to 8)
+_octas_to_metar = tuple(cloudiness_attribution[i] for i in range(-1, 9))
+
+# Constrained types shared by several fields
+_direction = typing.Annotated[int, Ge(0), Le(360)]  # degrees
+_positive_float = typing.Annotated[float, Gt(0)]
+_non_negative_float = typing.Annotated[float, Ge(0)]
+
 
 class Person(pydantic.BaseModel):
     """
     Class to describe a contact person
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
+    model_config = _STRICT_CONFIG
 
-    id: typing.Optional[str] = None
-    name: typing.Optional[str] = None
-    website: typing.Optional[str] = None
-    comment: typing.Optional[str] = None
-    additional_data: typing.Optional[AdditionalData] = None
+    id: str | None = None
+    name: str | None = None
+    website: str | None = None
+    comment: str | None = None
+    additional_data: AdditionalData | None = None
 
 
-class Time(pydantic.BaseModel, BaseMergeable):
+class Time(pydantic.BaseModel, BaseMergeable, BaseRevalidatable):
     """
     Class to store the date and time of observation (and additional date/time considerations)
 
     If left empty, the time zone will be automatically filled and the time zone is assumed to be UTC.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
+    model_config = _STRICT_CONFIG
 
     record_time: datetime_with_tz = pydantic.Field(
-        datetime.datetime.now(),
+        default_factory=lambda: datetime.datetime.now(datetime.timezone.utc),
         description="Time of the observation or measurement (python datetime object).")
     record_period: datetime_tuple_with_tz = pydantic.Field(
         (None, None),
         description="Time period of the observation "
         "(tuple of two python datetime objects giving the start time and the end time).")
-    report_time: typing.Optional[datetime_with_tz] = pydantic.Field(
+    report_time: datetime_with_tz | None = pydantic.Field(
         None,
         description="Reporting time of the observation (python datetime object).")
-    last_edition_time: typing.Optional[datetime_with_tz] = pydantic.Field(
+    last_edition_time: datetime_with_tz | None = pydantic.Field(
         None,
         description="Last edition time of the observation (python datetime object).")
-    comment: typing.Optional[str] = pydantic.Field(
+    comment: str | None = pydantic.Field(
         None,
         description="Comment on the date and time of observation (str)")
-    additional_data: typing.Optional[AdditionalData] = pydantic.Field(
+    additional_data: AdditionalData | None = pydantic.Field(
         None,
         description="Field to store additional data for CAAML compatibility (customData), do not use.")
 
 
+# Read once from the configuration, a new Person is built for each Observer
+_default_contact_person = dict(
+    name=conf.get('DEFAULT', 'contact_person_name', fallback=None),
+    id=conf.get('DEFAULT', 'contact_person_id', fallback=None),
+    comment=conf.get('DEFAULT', 'contact_person_comment', fallback=None))
+
+
 class Observer(pydantic.BaseModel, BaseMergeable):
     """
     Class to store information about the observer and about the institution / lab.
@@ -84,23 +108,43 @@ class Observer(pydantic.BaseModel, BaseMergeable):
     ``additional_data``
       Field to store additional data for CAAML compatibility (customData), do not use.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
+    model_config = _STRICT_CONFIG
+
+    source_id: str | None = conf.get('DEFAULT', 'observer_id', fallback=None)
+    source_name: str | None = conf.get('DEFAULT', 'observer_name', fallback=None)
+    source_website: str | None = None
+    source_comment: str | None = conf.get('DEFAULT', 'observer_comment', fallback=None)
+    source_additional_data: AdditionalData | None = None
+
+    contact_persons: typing.List[Person] = pydantic.Field(
+        default_factory=lambda: [Person(**_default_contact_person)], min_length=1)
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_country(country: str) -> str:
+    """
+    Upper case country code, checked against the ISO 3166 codes
+    """
+    country = country.upper()
+    if country not in COUNTRY_CODES:
+        raise ValueError(f'Unknown country code {country} (ISO 3166 alpha-2 code expected).')
+    return sys.intern(country)
 
-    source_id: typing.Optional[str] = conf.get('DEFAULT', 'observer_id', fallback=None)
-    source_name: typing.Optional[str] = conf.get('DEFAULT', 'observer_name', fallback=None)
-    source_website: typing.Optional[str] = None
-    source_comment: typing.Optional[str] = conf.get('DEFAULT', 'observer_comment', fallback=None)
-    source_additional_data: typing.Optional[AdditionalData] = None
 
-    contact_persons: typing.List[Person] = pydantic.Field([Person(
-        name=conf.get('DEFAULT', 'contact_person_name', fallback=None),
-        id=conf.get('DEFAULT', 'contact_person_id', fallback=None),
-        comment=conf.get('DEFAULT', 'contact_person_comment', fallback=None)), ], min_length=1)
+def _preprocess_country(country: str | None) -> str | None:
+    """
+    Ensure country code is upper case and is a valid ISO 3166 code
+    """
+    if country is not None:
+        if not isinstance(country, str):
+            raise ValueError(f'Country code should be a string (ISO 3166 alpha-2 code), not {type(country).__name__}.')
+        if country in COUNTRY_CODES:  # Already upper case (e.g. read from CAAML)
+            return sys.intern(country)
+        return _normalize_country(country)
+    return None
 
 
-class Location(pydantic.BaseModel, BaseMergeable):
+class Location(pydantic.BaseModel, BaseMergeable, BaseRevalidatable):
     """
     Class to store information on the measurement location
     (geographical position and details of the observation site).
@@ -143,54 +187,54 @@ class Location(pydantic.BaseModel, BaseMergeable):
     ``additonal_data``
       Field to store additional data for CAAML compatibility (customData), do not use.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
+    model_config = _STRICT_CONFIG
 
-    id: typing.Optional[str] = None
+    id: str | None = None
     name: str
-    point_type: typing.Optional[str] = None
-    aspect: typing.Optional[int] = pydantic.Field(None, ge=0, le=360)
-    elevation: typing.Optional[int] = None
-    slope: typing.Optional[int] = pydantic.Field(None, ge=0, lt=90)
-    latitude: typing.Optional[float] = None
-    longitude: typing.Optional[float] = None
-    country: typing.Optional[typing.Literal[
-        "AD", "AE", "AF", "AG", "AL", "AM", "AO", "AR", "AT", "AU",
-        "AZ", "BA", "BB", "BD", "BE", "BF", "BG", "BH", "BI", "BJ",
-        "BN", "BO", "BQ", "BR", "BS", "BT", "BW", "BY", "BZ", "CA",
-        "CD", "CF", "CG", "CH", "CI", "CL", "CM", "CN", "CO", "CR",
-        "CU", "CV", "CY", "CZ", "DE", "DJ", "DK", "DM", "DO", "DZ",
-        "EC", "EE", "EG", "ER", "ES", "ET", "FI", "FJ", "FM", "FR",
-        "GA", "GB", "GD", "GE", "GH", "GL", "GM", "GN", "GQ", "GR",
-        "GT", "GW", "GY", "HN", "HR", "HT", "HU", "ID", "IE", "IL",
-        "IN", "IQ", "IR", "IS", "IT", "JM", "JO", "JP", "KE", "KG",
-        "KH", "KI", "KM", "KN", "KP", "KR", "KW", "KZ", "LA", "LB",
-        "LC", "LI", "LK", "LR", "LS", "LT", "LU", "LV", "LY", "MA",
-        "MC", "MD", "ME", "MG", "MH", "MK", "ML", "MM", "MN", "MR",
-        "MT", "MU", "MV", "MW", "MX", "MY", "MZ", "NA", "NE", "NG",
-        "NI", "NL", "NO", "NP", "NR", "NZ", "OM", "PA", "PE", "PG",
-        "PH", "PK", "PL", "PS", "PT", "PW", "PY", "QA", "RO", "RS",
-        "RU", "RW", "SA", "SB", "SC", "SD", "SE", "SG", "SH", "SI",
-        "SK", "SL", "SM", "SN", "SO", "SR", "SS", "ST", "SV", "SY",
-        "SZ", "TD", "TG", "TH", "TJ", "TL", "TM", "TN", "TO", "TR",
-        "TT", "TV", "TW", "TZ", "UA", "UG", "UM", "US", "UY", "UZ",
-        "VC", "VE", "VN", "VU", "WF", "WS", "YE", "ZA", "ZM", "ZW"]] = None  # ISO 3166
-    region: typing.Optional[str] = None
-    comment: typing.Optional[str] = None
-    additional_data: typing.Optional[AdditionalData] = None
-
-    @pydantic.field_validator('country', mode='before')
-    def _preprocess_country(country: typing.Optional[str]) -> typing.Optional[str]:
-        """
-        Ensure country code is upper case
-        """
-        if country is not None:
-            return country.upper()
-        return None
-
-
-class Weather(pydantic.BaseModel, BaseMergeable):
+    point_type: str | None = None
+    aspect: _direction | None = None
+    elevation: int | None = None
+    slope: typing.Annotated[int, Ge(0), Lt(90)] | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    country: typing.Annotated[
+        str | None,
+        pydantic.BeforeValidator(_preprocess_country),
+        pydantic.Field(json_schema_extra={'enum': sorted(COUNTRY_CODES)})] = None  # ISO 3166
+    region: str | None = None
+    comment: str | None = None
+    additional_data: AdditionalData | None = None
+
+
+def _preprocess_cloudiness(cloudiness: str | int | None) -> str | None:
+    """
+    Ensure cloudiness is upper case and convert octas to METAR code
+    """
+    if cloudiness is not None:
+        if isinstance(cloudiness, str):
+            return cloudiness.upper()
+        elif isinstance(cloudiness, int):
+            if -1 <= cloudiness <= 8:
+                return _octas_to_metar[cloudiness + 1]
+        return cloudiness
+    return None
+
+
+def _check_precipitation(precipitation: str | None) -> str | None:
+    """
+    Ensure precipitation is a known METAR code
+
+    Like country codes, the value is interned: it comes from a small vocabulary
+    and is shared between all the objects of large profile collections.
+    """
+    if precipitation is not None and not isinstance(precipitation, str):
+        raise ValueError(f'Precipitation code should be a string (METAR code), not {type(precipitation).__name__}.')
+    if precipitation is not None and precipitation not in PRECIPITATION_CODES:
+        raise ValueError(f'Unknown precipitation code {precipitation}.')
+    return None if precipitation is None else sys.intern(precipitation)
+
+
+class Weather(pydantic.BaseModel, BaseMergeable, BaseRevalidatable):
     """
     Class to store the weather at time of observation.
 
@@ -248,39 +292,23 @@ class Weather(pydantic.BaseModel, BaseMergeable):
     ``additonal_data``
       Field to store additional data for CAAML compatibility (customData), do not use.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
-
-    cloudiness: typing.Optional[typing.Literal[
-        'CLR', 'FEW', 'SCT', 'BKN', 'OVC', 'X']] = None
-    precipitation: typing.Optional[typing.Literal[
-        "-DZ", "DZ", "+DZ", "-RA", "RA", "+RA", "-SN", "SN", "+SN",
-        "-SG", "SG", "+SG", "-IC", "IC", "+IC", "-PE", "PE", "+PE",
-        "-GR", "GR", "+GR", "-GS", "GS", "+GS"
-        "UP", "Nil", "RASN", "FZRA"]] = None
-    air_temperature: typing.Optional[float] = None
-    air_humidity: typing.Optional[float] = pydantic.Field(None, ge=0, le=100)
-    wind_speed: typing.Optional[float] = pydantic.Field(None, ge=0)
-    wind_direction: typing.Optional[int] = pydantic.Field(None, ge=0, le=360)
-    air_temperature_measurement_height: typing.Optional[float] = pydantic.Field(None, gt=0)
-    wind_measurement_height: typing.Optional[float] = pydantic.Field(None, gt=0)
-    comment: typing.Optional[str] = None
-    additional_data: typing.Optional[AdditionalData] = None
-
-    @pydantic.field_validator('cloudiness', mode='before')
-    def _preprocess_cloudiness(cloudiness: typing.Optional[str | int]) -> typing.Optional[str]:
-        """
-        Ensure cloudiness is upper case and convert octas to METAR code
-        """
-        if cloudiness is not None:
-            if isinstance(cloudiness, str):
-                return cloudiness.upper()
-            elif isinstance(cloudiness, int):
-                if cloudiness in cloudiness_attribution:
-                    return cloudiness_attribution[cloudiness]
-            return cloudiness
-        return None
+    model_config = _STRICT_CONFIG
+
+    cloudiness: typing.Annotated[
+        typing.Literal['CLR', 'FEW', 'SCT', 'BKN', 'OVC', 'X'] | None,
+        pydantic.BeforeValidator(_preprocess_cloudiness)] = None
+    precipitation: typing.Annotated[
+        str | None,
+        pydantic.BeforeValidator(_check_precipitation),
+        pydantic.Field(json_schema_extra={'enum': sorted(PRECIPITATION_CODES)})] = None  # METAR code
+    air_temperature: float | None = None
+    air_humidity: typing.Annotated[float, Ge(0), Le(100)] | None = None
+    wind_speed: _non_negative_float | None = None
+    wind_direction: _direction | None = None
+    air_temperature_measurement_height: _positive_float | None = None
+    wind_measurement_height: _positive_float | None = None
+    comment: str | None = None
+    additional_data: AdditionalData | None = None
 
 
 class SpectralAlbedo(pydantic.BaseModel, BaseData, BaseMergeable):
@@ -294,13 +322,10 @@ class SpectralAlbedo(pydantic.BaseModel, BaseData, BaseMergeable):
 
     and optionnally ``uncertainty`` (same unit as data) and/or ``quality`` (see :ref:`uncertainty`).
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid',
-        arbitrary_types_allowed=True)
+    model_config = _STRICT_CONFIG_ARB
 
-    comment: typing.Optional[str] = None
-    _data_config = dict(
+    comment: str | None = None
+    _data_config: typing.ClassVar[dict] = dict(
         _mode='Spectral',
         albedo=dict(min=0, max=1),
         uncertainty=dict(optional=True,
@@ -312,7 +337,7 @@ class SpectralAlbedo(pydantic.BaseModel, BaseData, BaseMergeable):
 
     def __init__(self, data=None, data_dict=None, **kwargs):
         super().__init__(**kwargs)
-        checker = get_dataframe_checker(**self._data_config)
+        checker = self._get_checker()
         if data is not None:
             self._data = checker(data)
         elif data_dict is not None:
@@ -331,12 +356,9 @@ class SolarMask(pydantic.BaseModel, BaseData):
     - ``elevation`` (in degrees from horizontal)
 
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid',
-        arbitrary_types_allowed=True)
+    model_config = _STRICT_CONFIG_ARB
 
-    _data_config = dict(
+    _data_config: typing.ClassVar[dict] = dict(
         _mode='None',
         azimuth=dict(min=0, max=360),
         elevation=dict(min=-90, max=90),
@@ -344,7 +366,7 @@ class SolarMask(pydantic.BaseModel, BaseData):
 
     def __init__(self, data=None, data_dict=None, **kwargs):
         super().__init__(**kwargs)
-        checker = get_dataframe_checker(**self._data_config)
+        checker = self._get_checker()
         if data is not None:
             self._data = checker(data)
         elif data_dict is not None:
@@ -353,7 +375,7 @@ class SolarMask(pydantic.BaseModel, BaseData):
             raise ValueError('data key is required')
 
 
-class SurfaceConditions(pydantic.BaseModel, BaseMergeable):
+class SurfaceConditions(pydantic.BaseModel, BaseMergeable, BaseRevalidatable):
     """
     Class to describe the snow surface conditions.
 
@@ -453,13 +475,11 @@ class SurfaceConditions(pydantic.BaseModel, BaseMergeable):
     ``additonal_data``
      Field to store additional data for CAAML compatibility (customData), do not use.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid')
+    model_config = _STRICT_CONFIG
 
-    surface_roughness: typing.Optional[typing.Literal[
-        'rsm', 'rwa', 'rcv', 'rcx', 'rrd']] = None
-    surface_wind_features: typing.Optional[typing.Literal[
+    surface_roughness: typing.Literal[
+        'rsm', 'rwa', 'rcv', 'rcx', 'rrd'] | None = None
+    surface_wind_features: typing.Literal[
         "No observable wind bedforms",
         "Snowdrift around obstacles",
         "Snow ripples",
@@ -471,33 +491,33 @@ class SurfaceConditions(pydantic.BaseModel, BaseMergeable):
         "Snow steps",
         "Sastrugi",
         "mixed",
-        "other"]] = None
-    surface_melt_rain_features: typing.Optional[typing.Literal[
+        "other"] | None = None
+    surface_melt_rain_features: typing.Literal[
         "Sun cups",
         "Penitents",
         "Melt or rain furrows",
-        "other"]] = None
-    surface_features_amplitude: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_amplitude_min: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_amplitude_max: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_wavelength: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_wavelength_min: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_wavelength_max: typing.Optional[float] = pydantic.Field(None, gt=0)
-    surface_features_aspect: typing.Optional[int] = pydantic.Field(None, ge=0, le=360)
-    lap_presence: typing.Optional[typing.Literal[
+        "other"] | None = None
+    surface_features_amplitude: _positive_float | None = None
+    surface_features_amplitude_min: _positive_float | None = None
+    surface_features_amplitude_max: _positive_float | None = None
+    surface_features_wavelength: _positive_float | None = None
+    surface_features_wavelength_min: _positive_float | None = None
+    surface_features_wavelength_max: _positive_float | None = None
+    surface_features_aspect: _direction | None = None
+    lap_presence: typing.Literal[
         "No LAP", "Black Carbon", "Dust",
-        "Mixed", "other"]] = None
-    surface_temperature: typing.Optional[float] = None
-    surface_temperature_measurement_method: typing.Optional[typing.Literal[
-        'Thermometer', 'Hemispheric IR', 'IR thermometer', 'other']] = None
-    surface_albedo: typing.Optional[float] = None
-    surface_albedo_comment: typing.Optional[str] = None
-    spectral_albedo: typing.Optional[SpectralAlbedo] = None
-    penetration_ram: typing.Optional[float] = pydantic.Field(None, ge=0)
-    penetration_foot: typing.Optional[float] = pydantic.Field(None, ge=0)
-    penetration_ski: typing.Optional[float] = pydantic.Field(None, ge=0)
-    comment: typing.Optional[str] = None
-    additional_data: typing.Optional[AdditionalData] = None
+        "Mixed", "other"] | None = None
+    surface_temperature: float | None = None
+    surface_temperature_measurement_method: typing.Literal[
+        'Thermometer', 'Hemispheric IR', 'IR thermometer', 'other'] | None = None
+    surface_albedo: float | None = None
+    surface_albedo_comment: str | None = None
+    spectral_albedo: SpectralAlbedo | None = None
+    penetration_ram: _non_negative_float | None = None
+    penetration_foot: _non_negative_float | None = None
+    penetration_ski: _non_negative_float | None = None
+    comment: str | None = None
+    additional_data: AdditionalData | None = None
 
 
 class Environment(pydantic.BaseModel, BaseMergeable):
@@ -577,35 +597,32 @@ class Environment(pydantic.BaseModel, BaseMergeable):
     ``solar_mask_additional_data``
       Field to store additional data for CAAML compatibility (customData), do not use.
     """
-    model_config = pydantic.ConfigDict(
-        validate_assignment=True,
-        extra='forbid',
-        arbitrary_types_allowed=True)
+    model_config = _STRICT_CONFIG_ARB
 
-    solar_mask: typing.Optional[SolarMask] = pydantic.Field(
+    solar_mask: SolarMask | None = pydantic.Field(
         None,
         description="The spectral albedo data.")
-    solar_mask_method_of_measurement: typing.Optional[typing.Literal[
-        "Theodolite", "Manual measurement", "From DTM", "From DSM", "other"]] = None
-    solar_mask_uncertainty: typing.Optional[float] = pydantic.Field(None, ge=0)
-    solar_mask_quality: typing.Optional[typing.Literal[tuple(QUALITY_FLAGS)]] = None
-    solar_mask_comment: typing.Optional[str] = None
-    bed_surface: typing.Optional[typing.Literal[
+    solar_mask_method_of_measurement: typing.Literal[
+        "Theodolite", "Manual measurement", "From DTM", "From DSM", "other"] | None = None
+    solar_mask_uncertainty: _non_negative_float | None = None
+    solar_mask_quality: quality_flag | None = None
+    solar_mask_comment: str | None = None
+    bed_surface: typing.Literal[
         "Sea ice", "Glacier", "Ice cap", "Fresh water ice",
         "Wetlands", "Grassland", "Shrubs",
         "Rocks", "Bare ground",
         "Needle litter", "Broadleaf litter",
-        "Artificial surface", "Mixed", "Other"]] = None
-    bed_surface_comment: typing.Optional[str] = None
-    litter_thickness: typing.Optional[float] = pydantic.Field(None, ge=0)
-    ice_thickness: typing.Optional[float] = pydantic.Field(None, ge=0)
-    low_vegetation_height: typing.Optional[float] = pydantic.Field(None, ge=0)
-    LAI: typing.Optional[float] = pydantic.Field(None, ge=0)
-    forest_presence: typing.Optional[typing.Literal[
+        "Artificial surface", "Mixed", "Other"] | None = None
+    bed_surface_comment: str | None = None
+    litter_thickness: _non_negative_float | None = None
+    ice_thickness: _non_negative_float | None = None
+    low_vegetation_height: _non_negative_float | None = None
+    LAI: _non_negative_float | None = None
+    forest_presence: typing.Literal[
         "Open Area", "Broadleaf forest", "Needle forest",
-        "Mixed forest", "Shrubs", "Other"]] = pydantic.Field(
+        "Mixed forest", "Shrubs", "Other"] | None = pydantic.Field(
             None,)
-    forest_presence_comment: typing.Optional[str] = None
-    sky_view_factor: typing.Optional[float] = pydantic.Field(None, ge=0, le=1)
-    tree_height: typing.Optional[float] = pydantic.Field(None, ge=0)
-    solar_mask_additional_data: typing.Optional[AdditionalData] = None
+    forest_presence_comment: str | None = None
+    sky_view_factor: typing.Annotated[float, Ge(0), Le(1)] | None = None
+    tree_height: _non_negative_float | None = None
+    solar_mask_additional_data: AdditionalData | None = None
@@ -5,8 +5,18 @@ import xml.etree.ElementTree as ET
 import re
 
 from snowprofile.io._caaml_parse_utils import _parse_str, _parse_numeric, _parse_additional_data, \
-    _parse_list, _parse_numeric_list, _search_gml_id, _parse_lat_lon
+    _parse_list, _search_gml_id, _parse_lat_lon, _find, _findall, _find_first, _find_steps, _compile_path, \
+    _element_str, _element_numeric, _element_numeric_list
 from snowprofile import _constants
+from snowprofile import SnowProfile
+from snowprofile.classes import Time, Observer, Location, Environment, Weather, SurfaceConditions, Person, \
+    SolarMask, SpectralAlbedo
+from snowprofile.profiles import Stratigraphy, TemperatureProfile, DensityProfile, LWCProfile, SSAProfile, \
+    SSAPointProfile, HardnessProfile, HardnessPointProfile, StrengthProfile, ImpurityProfile, ScalarProfile, \
+    VectorialProfile
+from snowprofile.stability_tests import RBStabilityTest, RBStabilityTestResult, CTStabilityTest, \
+    CTStabilityTestResult, ECTStabilityTest, ECTStabilityTestResult, PSTStabilityTest, ShearFrameStabilityTest, \
+    ShearFrameStabilityTestResult
 
 
 def read_caaml6_xml(filename):
@@ -53,40 +63,35 @@ def read_caaml6_xml(filename):
         ns = None
         nss = ''
     else:
-        r = re.match('{(.*)}SnowProfile$', root.tag)
-        if r is None:
+        if not (root.tag.endswith('}SnowProfile') and root.tag[0] == '{'):
             logging.error(f"The root element of {filename} is not a SnowProfile element. "
                           "This is not a valid CAAML file.")
             return None
         else:
-            ns = r.group(1)
+            ns = root.tag[1:-len('}SnowProfile')]
             nss = '{' + ns + '}'
     logging.debug(f"Parsing {filename}. Found CAAML namespace as {nss}")
 
     # Parsing part by part
-    from snowprofile import SnowProfile
-    from snowprofile.classes import Time, Observer, Location, Environment, Weather, SurfaceConditions
 
     # - Time
+    e_time = root.find(f'{nss}timeRef')
     time = Time(
-        record_time=_parse_str(root, [f'{nss}timeRef/{nss}recordTime/{nss}TimeInstant/{nss}timePosition',
-                                      f'{nss}timeRef/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition']),
+        record_time=_parse_str(e_time, [f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition',
+                                        f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition']),
         record_period=(
-            _parse_str(root, f'{nss}timeRef/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-            _parse_str(root, f'{nss}timeRef/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
-        report_time=_parse_str(root, f'{nss}timeRef/{nss}dateTimeReport'),
-        last_edition_time=_parse_str(root, f'{nss}timeRef/{nss}dateTimeLastEdit'),
-        comment=_parse_str(root, f'{nss}timeRef/{nss}metaData/{nss}comment'),
-        additional_data=_parse_additional_data(root.find(f'{nss}timeRef/{nss}customData')))
+            _parse_str(e_time, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+            _parse_str(e_time, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+        report_time=_parse_str(e_time, f'{nss}dateTimeReport'),
+        last_edition_time=_parse_str(e_time, f'{nss}dateTimeLastEdit'),
+        comment=_parse_str(e_time, f'{nss}metaData/{nss}comment'),
+        additional_data=_parse_additional_data(_find(e_time, f'{nss}customData')))
 
     # - Observer
-    observer = Observer(
-        source_id=_search_gml_id(root.find(f'{nss}srcRef/{nss}Operation')),
-        source_name=_parse_str(root, f'{nss}srcRef/{nss}Operation/{nss}name'),
-        source_comment=_parse_str(root, f'{nss}srcRef/{nss}Operation/{nss}metaData/{nss}comment'),
-        source_additional_data = _parse_additional_data(root.find(f'{nss}srcRef/{nss}Operation/{nss}customData')))
-    contact_persons_1 = root.findall(f'{nss}srcRef/{nss}Operation/{nss}contactPerson')
-    contact_persons_2 = root.findall(f'{nss}srcRef/{nss}Person')
+    e_src = root.find(f'{nss}srcRef')
+    e_operation = _find(e_src, f'{nss}Operation')
+    contact_persons_1 = _findall(e_operation, f'{nss}contactPerson')
+    contact_persons_2 = _findall(e_src, f'{nss}Person')
     contact_persons = []
     if contact_persons_1 is not None:
         for p in contact_persons_1:
@@ -94,168 +99,178 @@ def read_caaml6_xml(filename):
     if contact_persons_2 is not None:
         for p in contact_persons_2:
             contact_persons.append(_parse_contact_person(p, nss=nss, ns=ns))
-    if len(contact_persons) > 0:
-        observer.contact_persons = contact_persons
+    # Contact persons are given at init to avoid building the default one from the configuration
+    observer_kwargs = dict(contact_persons=contact_persons) if len(contact_persons) > 0 else {}
+    observer = Observer(
+        source_id=_search_gml_id(e_operation),
+        source_name=_parse_str(e_operation, f'{nss}name'),
+        source_comment=_parse_str(e_operation, f'{nss}metaData/{nss}comment'),
+        source_additional_data = _parse_additional_data(_find(e_operation, f'{nss}customData')),
+        **observer_kwargs)
 
     # - Location
     loc = root.find(f'{nss}locRef')
     lat, lon = _parse_lat_lon(loc.find(f'{nss}pointLocation'))
     location = Location(
         id=_search_gml_id(loc),
-        name=_parse_str(root, f'{nss}locRef/{nss}name'),
-        point_type=_parse_str(root, f'{nss}locRef/{nss}obsPointSubType'),
-        aspect=_parse_numeric(root, f'{nss}locRef/{nss}validAspect/{nss}AspectPosition/{nss}position',
+        name=_parse_str(loc, f'{nss}name'),
+        point_type=_parse_str(loc, f'{nss}obsPointSubType'),
+        aspect=_parse_numeric(loc, f'{nss}validAspect/{nss}AspectPosition/{nss}position',
                               attribution_table=_constants.aspects),
-        elevation=_parse_numeric(root, f'{nss}locRef/{nss}validElevation/{nss}ElevationPosition/{nss}position'),
-        slope=_parse_numeric(root, f'{nss}locRef/{nss}validSlopeAngle/{nss}SlopeAnglePosition/{nss}position'),
+        elevation=_parse_numeric(loc, f'{nss}validElevation/{nss}ElevationPosition/{nss}position'),
+        slope=_parse_numeric(loc, f'{nss}validSlopeAngle/{nss}SlopeAnglePosition/{nss}position'),
         latitude=lat,
         longitude = lon,
-        country=_parse_str(root, f'{nss}locRef/{nss}country'),
-        region=_parse_str(root, f'{nss}locRef/{nss}region'),
-        comment=_parse_str(root, f'{nss}locRef/{nss}metaData/{nss}comment'),
-        additional_data=_parse_additional_data(root.find(f'{nss}locRef/{nss}customData')))
+        country=_parse_str(loc, f'{nss}country'),
+        region=_parse_str(loc, f'{nss}region'),
+        comment=_parse_str(loc, f'{nss}metaData/{nss}comment'),
+        additional_data=_parse_additional_data(_find(loc, f'{nss}customData')))
 
     # - Environment
-    base = f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}weatherCond'
+    e_sm = loc.find(f'{nss}solarMask')
+    e_sm_md = _find(e_sm, f'{nss}solarMaskMetaData')
+    e_env = loc.find(f'{nss}obsPointEnvironment')
     environment = Environment(
-        solar_mask=_parse_solar_mask(root.find(f'{nss}locRef/{nss}solarMask'), nss=nss),
-        solar_mask_method_of_measurement=_parse_str(root, f'{nss}locRef/{nss}solarMask/{nss}solarMaskMetaData/{nss}methodOfMeas'),
-        solar_mask_uncertainty=_parse_numeric(root, f'{nss}locRef/{nss}solarMask/{nss}solarMaskMetaData/{nss}uncertaintyOfMeas'),
-        solar_mask_quality=_parse_str(root, f'{nss}locRef/{nss}solarMask/{nss}solarMaskMetaData/{nss}qualityOfMeas'),
-        solar_mask_comment=_parse_str(root, f'{nss}locRef/{nss}solarMask/{nss}solarMaskMetaData/{nss}comment'),
-        solar_mask_additional_data=_parse_additional_data(root.find(f'{nss}locRef/{nss}solarMask/{nss}customData')),
-        bed_surface=_parse_str(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}bedSurface'),
-        bed_surface_comment=_parse_str(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}bedSurfaceComment'),
-        litter_thickness=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}litterThickness'),
-        ice_thickness=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}iceThickness'),
-        low_vegetation_height=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}lowVegetationHeight'),
-        LAI=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}lai'),
-        forest_presence=_parse_str(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}forestPresence'),
-        forest_presence_comment=_parse_str(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}forestComment'),
-        sky_view_factor=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}skyViewFactor'),
-        tree_height=_parse_numeric(root, f'{nss}locRef/{nss}obsPointEnvironment/{nss}treeHeight'))
+        solar_mask=_parse_solar_mask(e_sm, nss=nss),
+        solar_mask_method_of_measurement=_parse_str(e_sm_md, f'{nss}methodOfMeas'),
+        solar_mask_uncertainty=_parse_numeric(e_sm_md, f'{nss}uncertaintyOfMeas'),
+        solar_mask_quality=_parse_str(e_sm_md, f'{nss}qualityOfMeas'),
+        solar_mask_comment=_parse_str(e_sm_md, f'{nss}comment'),
+        solar_mask_additional_data=_parse_additional_data(_find(e_sm, f'{nss}customData')),
+        bed_surface=_parse_str(e_env, f'{nss}bedSurface'),
+        bed_surface_comment=_parse_str(e_env, f'{nss}bedSurfaceComment'),
+        litter_thickness=_parse_numeric(e_env, f'{nss}litterThickness'),
+        ice_thickness=_parse_numeric(e_env, f'{nss}iceThickness'),
+        low_vegetation_height=_parse_numeric(e_env, f'{nss}lowVegetationHeight'),
+        LAI=_parse_numeric(e_env, f'{nss}lai'),
+        forest_presence=_parse_str(e_env, f'{nss}forestPresence'),
+        forest_presence_comment=_parse_str(e_env, f'{nss}forestComment'),
+        sky_view_factor=_parse_numeric(e_env, f'{nss}skyViewFactor'),
+        tree_height=_parse_numeric(e_env, f'{nss}treeHeight'))
 
     # - Weather
-    base = f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}weatherCond'
+    e_meas = _find(root, f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements')
+    e_weather = _find(e_meas, f'{nss}weatherCond')
     weather = Weather(
-        cloudiness=_parse_str(root, f'{base}/{nss}skyCond'),
-        precipitation=_parse_str(root, f'{base}/{nss}precipTI'),
-        air_temperature=_parse_numeric(root, f'{base}/{nss}airTempPres'),
+        cloudiness=_parse_str(e_weather, f'{nss}skyCond'),
+        precipitation=_parse_str(e_weather, f'{nss}precipTI'),
+        air_temperature=_parse_numeric(e_weather, f'{nss}airTempPres'),
         wind_speed=_parse_numeric(
-            root, f'{base}/{nss}windSpd',
+            e_weather, f'{nss}windSpd',
             attribution_table=_constants.wind_speed),
         wind_direction=_parse_numeric(
-            root, f'{base}/{nss}windDir/{nss}AspectPosition/{nss}position',
+            e_weather, f'{nss}windDir/{nss}AspectPosition/{nss}position',
             attribution_table=_constants.aspects),
         air_temperature_measurement_height=_parse_numeric(
-            root,
-            f'{base}/{nss}metaData/{nss}airTempMeasurementHeight'),
+            e_weather,
+            f'{nss}metaData/{nss}airTempMeasurementHeight'),
         wind_measurement_height=_parse_numeric(
-            root,
-            f'{base}/{nss}metaData/{nss}windMeasurementHeight'),
+            e_weather,
+            f'{nss}metaData/{nss}windMeasurementHeight'),
         comment = _parse_str(
-            root,
-            f'{base}/{nss}metaData/{nss}comment'),
-        additional_data=_parse_additional_data(root.find(
-            f'{base}/{nss}customData')))
+            e_weather,
+            f'{nss}metaData/{nss}comment'),
+        additional_data=_parse_additional_data(_find(e_weather,
+            f'{nss}customData')))
 
     # - Surface Conditions
-    base = f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}surfCond'
+    e_surf = _find(e_meas, f'{nss}surfCond')
+    e_surf_comp = _find(e_surf, f'{nss}surfFeatures/{nss}Components')
     surface_conditions = SurfaceConditions(
         surface_roughness=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfRoughness'),
+            e_surf_comp,
+            f'{nss}surfRoughness'),
         surface_wind_features=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfWindFeatures'),
+            e_surf_comp,
+            f'{nss}surfWindFeatures'),
         surface_melt_rain_features=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfMeltRainFeatures'),
+            e_surf_comp,
+            f'{nss}surfMeltRainFeatures'),
         surface_features_amplitude=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validAmplitude/{nss}AmplitudePosition/{nss}position',
+            e_surf_comp,
+            f'{nss}validAmplitude/{nss}AmplitudePosition/{nss}position',
             factor=0.01),  # cm -> m
         surface_features_amplitude_min=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validAmplitude/{nss}AmplitudeRange/{nss}beginPosition',
+            e_surf_comp,
+            f'{nss}validAmplitude/{nss}AmplitudeRange/{nss}beginPosition',
             factor=0.01),  # cm -> m
         surface_features_amplitude_max=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validAmplitude/{nss}AmplitudeRange/{nss}endPosition',
+            e_surf_comp,
+            f'{nss}validAmplitude/{nss}AmplitudeRange/{nss}endPosition',
             factor=0.01),  # cm -> m
         surface_features_wavelength=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validWavelength/{nss}WavelengthPosition/{nss}position',
+            e_surf_comp,
+            f'{nss}validWavelength/{nss}WavelengthPosition/{nss}position',
             factor=1),  # m
         surface_features_wavelength_min=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validWavelength/{nss}WavelengthRange/{nss}beginPosition',
+            e_surf_comp,
+            f'{nss}validWavelength/{nss}WavelengthRange/{nss}beginPosition',
             factor=1),  # m
         surface_features_wavelength_max=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validWavelength/{nss}WavelengthRange/{nss}endPosition',
+            e_surf_comp,
+            f'{nss}validWavelength/{nss}WavelengthRange/{nss}endPosition',
             factor=1),  # m
         surface_features_aspect=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}validAspect/{nss}AspectPosition/{nss}position'),
+            e_surf_comp,
+            f'{nss}validAspect/{nss}AspectPosition/{nss}position'),
         penetration_ram=_parse_numeric(
-            root,
-            f'{base}/{nss}penetrationRam',
+            e_surf,
+            f'{nss}penetrationRam',
             factor=0.01),  # cm -> m
         penetration_foot=_parse_numeric(
-            root,
-            f'{base}/{nss}penetrationFoot',
+            e_surf,
+            f'{nss}penetrationFoot',
             factor=0.01),  # cm -> m
         penetration_ski=_parse_numeric(
-            root,
-            f'{base}/{nss}penetrationSki',
+            e_surf,
+            f'{nss}penetrationSki',
             factor=0.01),  # cm -> m
         lap_presence=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}lapPresence'),
+            e_surf_comp,
+            f'{nss}lapPresence'),
         surface_temperature=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfTemp/{nss}data'),
+            e_surf_comp,
+            f'{nss}surfTemp/{nss}data'),
         surface_temperature_measurement_method=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfTemp/{nss}methodOfMeas'),
+            e_surf_comp,
+            f'{nss}surfTemp/{nss}methodOfMeas'),
         surface_albedo=_parse_numeric(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfAlbedo/{nss}albedo/{nss}albedoMeasurement'),
+            e_surf_comp,
+            f'{nss}surfAlbedo/{nss}albedo/{nss}albedoMeasurement'),
         surface_albedo_comment=_parse_str(
-            root,
-            f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfAlbedo/{nss}albedo/{nss}metaData/{nss}comment'),
+            e_surf_comp,
+            f'{nss}surfAlbedo/{nss}albedo/{nss}metaData/{nss}comment'),
         spectral_albedo=_parse_spectral_albedo(
-            root.find(
-                f'{base}/{nss}surfFeatures/{nss}Components/{nss}surfAlbedo/{nss}spectralAlbedo'),
+            _find(e_surf_comp,
+                f'{nss}surfAlbedo/{nss}spectralAlbedo'),
             nss=nss),
         comment=_parse_str(
-            root,
-            f'{base}/{nss}metaData/{nss}comment'),
-        additional_data=_parse_additional_data(root.find(
-            f'{base}/{nss}customData')))
+            e_surf,
+            f'{nss}metaData/{nss}comment'),
+        additional_data=_parse_additional_data(_find(e_surf,
+            f'{nss}customData')))
 
     # Creating SnowProfile object
-    base = f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}snowPackCond'
+    e_snowpack = _find(e_meas, f'{nss}snowPackCond')
 
     # Profile depth is not taken by default from the profileDepth element, to be coherent
     # with NiViz.
     profile_depth = _parse_numeric(
-        root,
-        f'{base}/{nss}hS/{nss}Components/{nss}height',
+        e_snowpack,
+        f'{nss}hS/{nss}Components/{nss}height',
         factor=0.01)  # cm -> m
     if profile_depth is None:
         profile_depth = _parse_numeric(
-            root,
-            f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}profileDepth',
+            e_meas,
+            f'{nss}profileDepth',
             factor=0.01)
 
     sp = SnowProfile(
         id=_search_gml_id(root),
         comment=_parse_str(root, f'{nss}metaData/{nss}comment'),
         profile_comment=_parse_str(
-            root,
-            f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}metaData/{nss}comment'),
+            e_meas,
+            f'{nss}metaData/{nss}comment'),
         time=time,
         observer=observer,
         location=location,
@@ -266,76 +281,76 @@ def read_caaml6_xml(filename):
         application_version=_parse_str(root, f'{nss}applicationVersion'),
         profile_depth=profile_depth,
         profile_depth_std=_parse_numeric(
-            root,
-            f'{base}/{nss}hSVariability/{nss}Components/{nss}height',
+            e_snowpack,
+            f'{nss}hSVariability/{nss}Components/{nss}height',
             factor=0.01),
         profile_swe=_parse_numeric(
-            root,
-            f'{base}/{nss}hS/{nss}Components/{nss}waterEquivalent',
+            e_snowpack,
+            f'{nss}hS/{nss}Components/{nss}waterEquivalent',
             factor=1),  # kg/m2 is the only one accepted
         profile_swe_std=_parse_numeric(
-            root,
-            f'{base}/{nss}hSVariability/{nss}Components/{nss}waterEquivalent',
+            e_snowpack,
+            f'{nss}hSVariability/{nss}Components/{nss}waterEquivalent',
             factor=1),
         new_snow_24_depth=_parse_numeric(
-            root,
-            f'{base}/{nss}hN24/{nss}Components/{nss}height',
+            e_snowpack,
+            f'{nss}hN24/{nss}Components/{nss}height',
             factor=0.01),  # cm -> m
         new_snow_24_depth_std=_parse_numeric(
-            root,
-            f'{base}/{nss}hIN/{nss}Components/{nss}height',
+            e_snowpack,
+            f'{nss}hIN/{nss}Components/{nss}height',
             factor=0.01),
         new_snow_24_swe=_parse_numeric(
-            root,
-            f'{base}/{nss}hN24/{nss}Components/{nss}waterEquivalent',
+            e_snowpack,
+            f'{nss}hN24/{nss}Components/{nss}waterEquivalent',
             factor=1),
         new_snow_24_swe_std=_parse_numeric(
-            root,
-            f'{base}/{nss}hIN/{nss}Components/{nss}waterEquivalent',
+            e_snowpack,
+            f'{nss}hIN/{nss}Components/{nss}waterEquivalent',
             factor=1),
         snow_transport=_parse_str(
-            root,
-            f'{base}/{nss}snowTransport'),
+            e_snowpack,
+            f'{nss}snowTransport'),
         snow_transport_occurence_24=_parse_numeric(
-            root,
-            f'{base}/{nss}snowTransportOccurrence24'),
+            e_snowpack,
+            f'{nss}snowTransportOccurrence24'),
         stratigraphy_profile = _parse_stratigraphy(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}stratProfile'),
+            _findall(e_meas, f'{nss}stratProfile'),
             nss=nss, profile_depth=profile_depth),
         temperature_profiles = _parse_temperature_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}tempProfile'),
+            _findall(e_meas, f'{nss}tempProfile'),
             nss=nss, profile_depth=profile_depth),
         density_profiles = _parse_density_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}densityProfile'),
+            _findall(e_meas, f'{nss}densityProfile'),
             nss=nss, profile_depth=profile_depth),
         lwc_profiles = _parse_lwc_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}lwcProfile'),
+            _findall(e_meas, f'{nss}lwcProfile'),
             nss=nss, profile_depth=profile_depth),
         ssa_profiles = _parse_ssa_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}specSurfAreaProfile'),
+            _findall(e_meas, f'{nss}specSurfAreaProfile'),
             nss=nss, profile_depth=profile_depth),
         hardness_profiles = _parse_hardness_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}hardnessProfile'),
+            _findall(e_meas, f'{nss}hardnessProfile'),
             nss=nss, profile_depth=profile_depth),
         strength_profiles = _parse_strength_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}strengthProfile'),
+            _findall(e_meas, f'{nss}strengthProfile'),
             nss=nss, profile_depth=profile_depth),
         impurity_profiles = _parse_impurity_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}impurityProfile'),
+            _findall(e_meas, f'{nss}impurityProfile'),
             nss=nss, profile_depth=profile_depth),
         other_scalar_profiles = _parse_other_scalar_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}otherScalarProfile'),
+            _findall(e_meas, f'{nss}otherScalarProfile'),
             nss=nss, profile_depth=profile_depth),
         other_vectorial_profiles = _parse_other_vectorial_profiles(
-            root.findall(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}otherVectorialProfile'),
+            _findall(e_meas, f'{nss}otherVectorialProfile'),
             nss=nss, profile_depth=profile_depth),
         stability_tests = _parse_stability_tests(
-            root.find(f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}stbTests'),
+            _find(e_meas, f'{nss}stbTests'),
             nss=nss, profile_depth=profile_depth),
         additional_data=_parse_additional_data(root.find(
             f'{nss}customData')),
-        profile_additional_data = _parse_additional_data(root.find(
-            f'{nss}snowProfileResultsOf/{nss}SnowProfileMeasurements/{nss}customData')))
+        profile_additional_data = _parse_additional_data(_find(e_meas,
+            f'{nss}customData')))
 
     return sp
 
@@ -343,7 +358,6 @@ def read_caaml6_xml(filename):
 def _parse_contact_person(p, nss='', ns=None):
     if p is None:
         return None
-    from snowprofile.classes import Person
     return Person(
         id=_search_gml_id(p),
         name=_parse_str(p, f'{nss}name'),
@@ -355,8 +369,6 @@ def _parse_solar_mask(sm_element, nss=''):
     if sm_element is None:
         return None
 
-    from snowprofile.classes import SolarMask
-
     data = _parse_generic_profile(
         sm_element.findall(f'{nss}Data'),
         {'azimuth': {'path': f'{nss}azimuth', 'type': 'numeric'},
@@ -370,8 +382,6 @@ def _parse_spectral_albedo(sa_element, nss=''):
     if sa_element is None:
         return None
 
-    from snowprofile.classes import SpectralAlbedo
-
     e = sa_element
     data = _parse_generic_profile(
         e.findall(f'{nss}spectralAlbedoMeasurement'),
@@ -392,30 +402,56 @@ def _parse_generic_profile(elements, definitions, nss='', min_columns=[]):
     # Eventully get the height to invert depth and height !!
     if elements is None or len(elements) == 0:
         return None
+    # Resolve the definitions once, values are then searched among the children
+    # of each element, collected by tag in a single sweep.
     results = {}
-    for key in definitions:
+    columns = []
+    for key, value in definitions.items():
         results[key] = []
+        path = value['path']
+        columns.append((
+            value['type'] if 'type' in value else None,
+            path,
+            _compile_path(path) if isinstance(path, str) else None,
+            value['numeric_factor'] if 'numeric_factor' in value else 1,
+            value['attribute'] if 'attribute' in value else None,
+            value['attribution_table'] if 'attribution_table' in value else None,
+            'adapt_total_depth' in value,
+            value['adapt_total_depth'] if 'adapt_total_depth' in value else None,
+            results[key]))
 
     for e in elements:
-        for key, value in definitions.items():
-            factor = value['numeric_factor'] if 'numeric_factor' in value else 1
-            attribute = value['attribute'] if 'attribute' in value else None
-            attribution_table = value['attribution_table'] if 'attribution_table' in value else None
-
-            if 'type' in value and value['type'] == 'numeric':
-                r = _parse_numeric(e, value['path'], factor=factor, attribute=attribute,
-                                   attribution_table=attribution_table)
-                if 'adapt_total_depth' in value:
-                    r = value['adapt_total_depth'] - r
-            elif 'type' in value and value['type'] == 'numeric_list':
-                r = _parse_numeric_list(e, value['path'], factor=factor, attribute=attribute)
+        children = {}
+        for child in e:
+            if child.tag in children:
+                children[child.tag].append(child)
+            else:
+                children[child.tag] = [child]
+
+        for _type, path, steps, factor, attribute, attribution_table, adapt, total_depth, column in columns:
+            if steps is None:
+                f = _find_first(e, path)
+            elif steps[0] not in children:
+                f = None
+            elif len(steps) == 1:
+                f = children[steps[0]][0]
+            else:
+                f = _find_steps(children[steps[0]], steps[1:])
+
+            if _type == 'numeric':
+                r = _element_numeric(f, factor=factor, attribute=attribute,
+                                     attribution_table=attribution_table)
+                if adapt:
+                    r = total_depth - r
+            elif _type == 'numeric_list':
+                r = _element_numeric_list(f, factor=factor, attribute=attribute)
             else:
-                r = _parse_str(e, value['path'], attribute=attribute,
-                               attribution_table=attribution_table)
-            results[key].append(r)
+                r = _element_str(f, attribute=attribute, attribution_table=attribution_table)
+            column.append(r)
 
     # Get rid of columns full of None
-    results = {key: value for key, value in results.items() if key in min_columns or set(value) != set([None])}
+    results = {key: value for key, value in results.items()
+               if key in min_columns or any(x is not None for x in value)}
 
     return results
 
@@ -430,8 +466,9 @@ def _parse_stratigraphy(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -464,18 +501,17 @@ def _parse_stratigraphy(elements, nss='', profile_depth=0):
             min_columns=['grain_1', 'grain_size', 'hardness', 'grain_2', 'wetness'],
             nss=nss)
 
-        from snowprofile.profiles import Stratigraphy
         s = Stratigraphy(
             id=_search_gml_id(elem),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -493,10 +529,11 @@ def _parse_temperature_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -512,22 +549,21 @@ def _parse_temperature_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}qualityOfMeas', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import TemperatureProfile
         s = TemperatureProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
             uncertainty_of_measurement = _parse_numeric(elem, f'{nss}tempMetaData/{nss}uncertaintyOfMeas'),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -545,10 +581,11 @@ def _parse_density_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -566,26 +603,25 @@ def _parse_density_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}density', 'attribute': 'quality', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import DensityProfile
         s = DensityProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            probed_volume = _parse_numeric(elem, f'{mdk}/{nss}probeVolume', factor=1e-6),
-            probed_diameter = _parse_numeric(elem, f'{mdk}/{nss}probeDiameter', factor=0.01),
-            probed_length = _parse_numeric(elem, f'{mdk}/{nss}probeLength', factor=0.01),
-            probed_thickness = _parse_numeric(elem, f'{mdk}/{nss}probedThickness', factor=0.01),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            probed_volume = _parse_numeric(e_md, f'{nss}probeVolume', factor=1e-6),
+            probed_diameter = _parse_numeric(e_md, f'{nss}probeDiameter', factor=0.01),
+            probed_length = _parse_numeric(e_md, f'{nss}probeLength', factor=0.01),
+            probed_thickness = _parse_numeric(e_md, f'{nss}probedThickness', factor=0.01),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -603,10 +639,11 @@ def _parse_lwc_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -624,23 +661,22 @@ def _parse_lwc_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}lwc', 'attribute': 'quality', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import LWCProfile
         s = LWCProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            probed_thickness = _parse_numeric(elem, f'{mdk}/{nss}probedThickness', factor=0.01),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            probed_thickness = _parse_numeric(e_md, f'{nss}probedThickness', factor=0.01),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -658,10 +694,11 @@ def _parse_ssa_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -673,21 +710,19 @@ def _parse_ssa_profiles(elements, nss='', profile_depth=0):
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            probed_thickness = _parse_numeric(elem, f'{mdk}/{nss}probedThickness', factor=0.01),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            probed_thickness = _parse_numeric(e_md, f'{nss}probedThickness', factor=0.01),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')))
 
-        from snowprofile.profiles import SSAProfile, SSAPointProfile
-
         # Layer profile of SSA
         data1 = _parse_generic_profile(
             elem.findall(f'{nss}Layer'),
@@ -709,7 +744,7 @@ def _parse_ssa_profiles(elements, nss='', profile_depth=0):
         # Point profile of SSA
         height = []
         ssa = []
-        e = elem.find(f'{nss}Measurements/{nss}tupleList')
+        e = _find(elem, f'{nss}Measurements/{nss}tupleList')
         if e is not None:
             t = e.text
             try:
@@ -748,10 +783,11 @@ def _parse_hardness_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -763,22 +799,20 @@ def _parse_hardness_profiles(elements, nss='', profile_depth=0):
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            surface_of_indentation = _parse_numeric(elem, f'{mdk}/{nss}surfOfIndentation', factor=0.0001),
-            penetration_speed = _parse_numeric(elem, f'{mdk}/{nss}penetrationSpeed', factor=1),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            surface_of_indentation = _parse_numeric(e_md, f'{nss}surfOfIndentation', factor=0.0001),
+            penetration_speed = _parse_numeric(e_md, f'{nss}penetrationSpeed', factor=1),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')))
 
-        from snowprofile.profiles import HardnessProfile, HardnessPointProfile
-
         # Ramsonde Profile of Hardness
         data1 = _parse_generic_profile(
             elem.findall(f'{nss}Layer'),
@@ -803,7 +837,7 @@ def _parse_hardness_profiles(elements, nss='', profile_depth=0):
         # Point profile of Hardness
         height = []
         res = []
-        e = elem.find(f'{nss}Measurements/{nss}tupleList')
+        e = _find(elem, f'{nss}Measurements/{nss}tupleList')
         if e is not None:
             t = e.text
             try:
@@ -842,10 +876,11 @@ def _parse_strength_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -864,24 +899,23 @@ def _parse_strength_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}strengthValue', 'attribute': 'quality', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import StrengthProfile
         s = StrengthProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            probed_area = _parse_numeric(elem, f'{mdk}/{nss}probedArea', factor=1e-4),
-            strength_type = _parse_str(elem, f'{mdk}/{nss}strengthType'),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            probed_area = _parse_numeric(e_md, f'{nss}probedArea', factor=1e-4),
+            strength_type = _parse_str(e_md, f'{nss}strengthType'),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -899,10 +933,11 @@ def _parse_impurity_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -923,27 +958,26 @@ def _parse_impurity_profiles(elements, nss='', profile_depth=0):
                          'attribute': 'quality', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import ImpurityProfile
         s = ImpurityProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            impurity_type = _parse_str(elem, f'{mdk}/{nss}impurity'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            probed_volume = _parse_numeric(elem, f'{mdk}/{nss}probedVolume', factor=1e-6),
-            probed_diameter = _parse_numeric(elem, f'{mdk}/{nss}probedDiameter', factor=0.01),
-            probed_length = _parse_numeric(elem, f'{mdk}/{nss}probedLength', factor=0.01),
-            probed_thickness = _parse_numeric(elem, f'{mdk}/{nss}probedThickness', factor=0.01),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            impurity_type = _parse_str(e_md, f'{nss}impurity'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            probed_volume = _parse_numeric(e_md, f'{nss}probedVolume', factor=1e-6),
+            probed_diameter = _parse_numeric(e_md, f'{nss}probedDiameter', factor=0.01),
+            probed_length = _parse_numeric(e_md, f'{nss}probedLength', factor=0.01),
+            probed_thickness = _parse_numeric(e_md, f'{nss}probedThickness', factor=0.01),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -961,10 +995,11 @@ def _parse_other_scalar_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -983,24 +1018,23 @@ def _parse_other_scalar_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}value', 'attribute': 'quality', 'type': 'str'}},
             nss=nss)
 
-        from snowprofile.profiles import ScalarProfile
         s = ScalarProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            parameter = _parse_str(elem, f'{mdk}/{nss}parameter'),
-            unit = _parse_str(elem, f'{mdk}/{nss}uom'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            parameter = _parse_str(e_md, f'{nss}parameter'),
+            unit = _parse_str(e_md, f'{nss}uom'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -1018,10 +1052,11 @@ def _parse_other_vectorial_profiles(elements, nss='', profile_depth=0):
     r = []
 
     for elem in elements:
+        e_md = elem.find(mdk)
         # Metadata
 
         # Get the profile depth
-        profile_depth_local = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}height',
+        profile_depth_local = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}height',
                                              factor=0.01)  # cm -> m
         if profile_depth_local is not None:
             _profile_depth = profile_depth_local
@@ -1040,25 +1075,24 @@ def _parse_other_vectorial_profiles(elements, nss='', profile_depth=0):
              'quality': {'path': f'{nss}value', 'attribute': 'quality', 'type': 'str'}},
             nss=nss, min_columns=['top_height', 'data'])
 
-        from snowprofile.profiles import VectorialProfile
         s = VectorialProfile(
             id=_search_gml_id(elem),
             profile_nr = _parse_numeric(elem, path=f'{nss}profileNr'),
             name = _parse_str(elem, path='.', attribute='name'),
             related_profiles = _parse_list(elem, '.', attribute='relatedProfiles'),
-            comment = _parse_str(elem, f'{mdk}/{nss}comment'),
-            parameter = _parse_str(elem, f'{mdk}/{nss}parameter'),
-            unit = _parse_str(elem, f'{mdk}/{nss}uom'),
-            rank = _parse_numeric(elem, f'{mdk}/{nss}rank'),
-            method_of_measurement = _parse_str(elem, f'{mdk}/{nss}methodOfMeas'),
-            quality_of_measurement = _parse_str(elem, f'{mdk}/{nss}qualityOfMeas'),
-            uncertainty_of_measurement = _parse_numeric(elem, f'{mdk}/{nss}uncertaintyOfMeas'),
-            record_time = _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
+            comment = _parse_str(e_md, f'{nss}comment'),
+            parameter = _parse_str(e_md, f'{nss}parameter'),
+            unit = _parse_str(e_md, f'{nss}uom'),
+            rank = _parse_numeric(e_md, f'{nss}rank'),
+            method_of_measurement = _parse_str(e_md, f'{nss}methodOfMeas'),
+            quality_of_measurement = _parse_str(e_md, f'{nss}qualityOfMeas'),
+            uncertainty_of_measurement = _parse_numeric(e_md, f'{nss}uncertaintyOfMeas'),
+            record_time = _parse_str(e_md, f'{nss}recordTime/{nss}TimeInstant/{nss}timePosition'),
             record_period = (
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
-                _parse_str(elem, f'{mdk}/{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}beginPosition'),
+                _parse_str(e_md, f'{nss}recordTime/{nss}TimePeriod/{nss}endPosition')),
             profile_depth = profile_depth_local,
-            profile_swe = _parse_numeric(elem, f'{mdk}/{nss}hS/{nss}Components/{nss}waterEquivalent'),
+            profile_swe = _parse_numeric(e_md, f'{nss}hS/{nss}Components/{nss}waterEquivalent'),
             additional_data = _parse_additional_data(elem.find(f'{nss}customData')),
             data = data)
         r.append(s)
@@ -1074,7 +1108,6 @@ def _parse_stability_tests(element, nss='', profile_depth=0):
 
     # RB tests
     for elementtest in element.findall(f'{nss}RBlockTest'):
-        from snowprofile.stability_tests import RBStabilityTest, RBStabilityTestResult
         _results = []
         for e in elementtest.findall(f'{nss}failedOn'):
             test_score = _parse_str(e, f'{nss}Results/{nss}testScore')
@@ -1096,7 +1129,6 @@ def _parse_stability_tests(element, nss='', profile_depth=0):
 
     # CT tests
     for elementtest in element.findall(f'{nss}ComprTest'):
-        from snowprofile.stability_tests import CTStabilityTest, CTStabilityTestResult
         _results = []
         for e in elementtest.findall(f'{nss}failedOn'):
             test_score = _parse_str(e, f'{nss}Results/{nss}testScore', attribution_table=_constants.CT_scores)
@@ -1117,7 +1149,6 @@ def _parse_stability_tests(element, nss='', profile_depth=0):
 
     # ECT tests
     for elementtest in element.findall(f'{nss}ExtColumnTest'):
-        from snowprofile.stability_tests import ECTStabilityTest, ECTStabilityTestResult
         _results = []
         for e in elementtest.findall(f'{nss}failedOn'):
             test_score = _parse_str(e, f'{nss}Results/{nss}testScore')
@@ -1143,7 +1174,6 @@ def _parse_stability_tests(element, nss='', profile_depth=0):
 
     # PST tests
     for elementtest in element.findall(f'{nss}PropSawTest'):
-        from snowprofile.stability_tests import PSTStabilityTest
         e = elementtest.find(f'{nss}failedOn')
         if e is not None:
             s = PSTStabilityTest(
@@ -1156,7 +1186,6 @@ def _parse_stability_tests(element, nss='', profile_depth=0):
 
     # Shear frame tests
     for elementtest in element.findall(f'{nss}ShearFrameTest'):
-        from snowprofile.stability_tests import ShearFrameStabilityTest, ShearFrameStabilityTestResult
         _results = []
         for e in elementtest.findall(f'{nss}failedOn'):
             _s = ShearFrameStabilityTestResult(
@@ -1198,4 +1227,4 @@ def _parse_generic_stability_test_result_fields(elem, nss='', profile_depth=0):
             _parse_str(elem, f'{nss}Layer/{nss}validFormationTime/{nss}TimePeriod/{nss}beginPosition'),
             _parse_str(elem, f'{nss}Layer/{nss}validFormationTime/{nss}TimePeriod/{nss}endPosition')),
         layer_comment = _parse_str(elem, f'{nss}Layer/{nss}metaData/{nss}comment'),
-        layer_additional_data = _parse_additional_data(elem.find(f'{nss}Layer/{nss}customData')))
+        layer_additional_data = _parse_additional_data(_find(elem, f'{nss}Layer/{nss}customData')))
@@ -38,6 +38,8 @@ def write_caaml6_xml(snowprofile, filename, version='6.0.5', indent=False):
         raise ValueError(f'Unsupported CAAML version {version}.')
     uri = table_versions_uri[version]
     ns = '{' + uri + '}'
+    version_tuple = _version_tuple(version)
+    is_v606 = version_tuple >= (6, 0, 6)  # Features introduced in CAAML v6.0.6
     ns_gml = '{' + uri_gml + '}'
 
     # Namespaces
@@ -45,482 +47,438 @@ def write_caaml6_xml(snowprofile, filename, version='6.0.5', indent=False):
     ET.register_namespace('gml', uri_gml)
 
     # Id management
-    id_list = []
+    # id_set: ids already used, id_counters: next suffix to try for a given base id
+    id_set = set()
+    id_counters = {}
 
     def _gen_id(id, default=None):
         if id is None and default is not None:
             return _gen_id(default)
         elif id is None and default is None:
             return _gen_id('id')
+        elif id not in id_set:
+            id_set.add(id)
+            return id
         else:
-            i = 1
-            id_test = id
-            while id_test in id_list:
-                id_test = f'{id}{i}'
+            i = id_counters.get(id, 1)
+            id_test = f'{id}{i}'
+            while id_test in id_set:
                 i += 1
-            id = id_test
-            id_list.append(id)
-            return id
+                id_test = f'{id}{i}'
+            id_counters[id] = i + 1
+            id_set.add(id_test)
+            return id_test
 
     config = {'_gen_id': _gen_id,
               'ns': ns,
+              'tags': _Tags(ns),
               'ns_gml': ns_gml,
               'profile_depth': snowprofile.profile_depth if snowprofile.profile_depth is not None else 0,
               'profile_swe': snowprofile.profile_swe,
-              'version': version}
+              'version': version,
+              'version_tuple': version_tuple,
+              'is_v606': is_v606}
+    tags = config['tags']
 
     if snowprofile.profile_depth is None:
         logging.warning('Profile depth not set. Ensure this is expected !')
 
 
     # Main XML element
-    root = ET.Element(f'{ns}SnowProfile', attrib={f'{ns_gml}id': _gen_id(snowprofile.id, 'snowprofile')})
+    root = ET.Element(tags['SnowProfile'], attrib={f'{ns_gml}id': _gen_id(snowprofile.id, 'snowprofile')})
 
     # - Metadata (optional)
     if snowprofile.comment is not None:
-        _ = ET.SubElement(root, f'{ns}metaData')
-        _ = ET.SubElement(_, f'{ns}comment')
-        _.text = snowprofile.comment
+        _add_meta_comment(root, snowprofile.comment, ns=ns)
 
     # - timeRef
-    time = ET.SubElement(root, f'{ns}timeRef')
-
-    if snowprofile.time.comment is not None:
-        _ = ET.SubElement(time, f'{ns}metaData')
-        _ = ET.SubElement(_, f'{ns}comment')
-        _.text = snowprofile.time.comment
-
-    record_time = ET.SubElement(time, f'{ns}recordTime')
-
-    if snowprofile.time.record_period[0] is not None and snowprofile.time.record_period[1] is not None:
-        _ = ET.SubElement(record_time, f'{ns}TimePeriod')
-        begin = ET.SubElement(_, f'{ns}beginPosition')
-        begin.text = snowprofile.time.record_period[0].isoformat()
-        end = ET.SubElement(_, f'{ns}endPosition')
-        end.text = snowprofile.time.record_period[1].isoformat()
-    elif snowprofile.time.record_time is not None:
-        _ = ET.SubElement(record_time, f'{ns}TimeInstant')
-        begin = ET.SubElement(_, f'{ns}timePosition')
-        begin.text = snowprofile.time.record_time.isoformat()
+    s_time = snowprofile.time
+    time = ET.SubElement(root, tags['timeRef'])
+
+    if s_time.comment is not None:
+        _add_meta_comment(time, s_time.comment, ns=ns)
+
+    record_time = ET.SubElement(time, tags['recordTime'])
+
+    if s_time.record_period[0] is not None and s_time.record_period[1] is not None:
+        _ = ET.SubElement(record_time, tags['TimePeriod'])
+        begin = ET.SubElement(_, tags['beginPosition'])
+        begin.text = s_time.record_period[0].isoformat()
+        end = ET.SubElement(_, tags['endPosition'])
+        end.text = s_time.record_period[1].isoformat()
+    elif s_time.record_time is not None:
+        _ = ET.SubElement(record_time, tags['TimeInstant'])
+        begin = ET.SubElement(_, tags['timePosition'])
+        begin.text = s_time.record_time.isoformat()
     else:
         logging.error('Could not find a valid record time or time period. Use current time')
-        _ = ET.SubElement(record_time, f'{ns}TimeInstant')
-        begin = ET.SubElement(_, f'{ns}timePosition')
+        _ = ET.SubElement(record_time, tags['TimeInstant'])
+        begin = ET.SubElement(_, tags['timePosition'])
         begin.text = datetime.datetime.now().isoformat()
 
-    if snowprofile.time.report_time is not None:
-        _ = ET.SubElement(time, f'{ns}dateTimeReport')
-        _.text = snowprofile.time.report_time.isoformat()
+    if s_time.report_time is not None:
+        _ = ET.SubElement(time, tags['dateTimeReport'])
+        _.text = s_time.report_time.isoformat()
 
-    if snowprofile.time.last_edition_time is not None:
-        _ = ET.SubElement(time, f'{ns}dateTimeLastEdit')
-        _.text = snowprofile.time.last_edition_time.isoformat()
+    if s_time.last_edition_time is not None:
+        _ = ET.SubElement(time, tags['dateTimeLastEdit'])
+        _.text = s_time.last_edition_time.isoformat()
 
-    _append_additional_data(time, snowprofile.time.additional_data, ns=ns)
+    _append_additional_data(time, s_time.additional_data, ns=ns)
 
     # - srcRef
-    src = ET.SubElement(root, f'{ns}srcRef')
-    if snowprofile.observer.source_name is None:
-        src = ET.SubElement(src, f'{ns}Person',
-                            attrib={f'{ns_gml}id': _gen_id(snowprofile.observer.contact_persons[0].id, 'person')})
-        if len(snowprofile.observer.contact_persons) > 1:
+    s_observer = snowprofile.observer
+    src = ET.SubElement(root, tags['srcRef'])
+    if s_observer.source_name is None:
+        s_person = s_observer.contact_persons[0]
+        src = ET.SubElement(src, tags['Person'], attrib={f'{ns_gml}id': _gen_id(s_person.id, 'person')})
+        if len(s_observer.contact_persons) > 1:
             logging.error('Observer: if you provide more than one contact person you need to provide a source name. '
                           'Only the first contact person will be used.')
-        if snowprofile.observer.contact_persons[0].comment is not None:
-            _ = ET.SubElement(src, f'{ns}metaData')
-            _ = ET.SubElement(_, f'{ns}comment')
-            _.text = snowprofile.observer.contact_persons[0].comment
-        _ = ET.SubElement(src, f'{ns}name')
-        if snowprofile.observer.contact_persons[0].name is not None:
-            _.text = snowprofile.observer.contact_persons[0].name
-        _append_additional_data(src, snowprofile.observer.contact_persons[0].additional_data, ns=ns)
+        if s_person.comment is not None:
+            _add_meta_comment(src, s_person.comment, ns=ns)
+        _ = ET.SubElement(src, tags['name'])
+        if s_person.name is not None:
+            _.text = s_person.name
+        _append_additional_data(src, s_person.additional_data, ns=ns)
     else:
-        op = ET.SubElement(src, f'{ns}Operation', attrib={f'{ns_gml}id': _gen_id(snowprofile.observer.source_id,
+        op = ET.SubElement(src, tags['Operation'], attrib={f'{ns_gml}id': _gen_id(s_observer.source_id,
                                                                                  'operation')})
-        if snowprofile.observer.source_comment is not None:
-            _ = ET.SubElement(op, f'{ns}metaData')
-            _ = ET.SubElement(_, f'{ns}comment')
-            _.text = snowprofile.observer.source_comment
-        _ = ET.SubElement(op, f'{ns}name')
-        _.text = snowprofile.observer.source_name
-        for person in snowprofile.observer.contact_persons:
-            p = ET.SubElement(op, f'{ns}contactPerson', attrib={f'{ns_gml}id': _gen_id(person.id, 'person')})
+        if s_observer.source_comment is not None:
+            _add_meta_comment(op, s_observer.source_comment, ns=ns)
+        _ = ET.SubElement(op, tags['name'])
+        _.text = s_observer.source_name
+        for person in s_observer.contact_persons:
+            p = ET.SubElement(op, tags['contactPerson'], attrib={f'{ns_gml}id': _gen_id(person.id, 'person')})
             if person.comment is not None:
-                _ = ET.SubElement(p, f'{ns}metaData')
-                _ = ET.SubElement(_, f'{ns}comment')
-                _.text = person.comment
-            name = ET.SubElement(p, f'{ns}name')  # Compulosry element (but no content is fine)
+                _add_meta_comment(p, person.comment, ns=ns)
+            name = ET.SubElement(p, tags['name'])  # Compulosry element (but no content is fine)
             if person.name is not None:
                 name.text = person.name
             _append_additional_data(p, person.additional_data, ns=ns)
-        _append_additional_data(op, snowprofile.observer.source_additional_data, ns=ns)
+        _append_additional_data(op, s_observer.source_additional_data, ns=ns)
 
     # locRef
-    src = ET.SubElement(root, f'{ns}locRef', attrib={f'{ns_gml}id': _gen_id(snowprofile.location.id, 'location')})
+    src = ET.SubElement(root, tags['locRef'], attrib={f'{ns_gml}id': _gen_id(snowprofile.location.id, 'location')})
     loc = snowprofile.location
     if loc.comment is not None:
-        _ = ET.SubElement(src, f'{ns}metaData')
-        _ = ET.SubElement(_, f'{ns}comment')
-        _.text = loc.comment
-    name = ET.SubElement(src, f'{ns}name')
+        _add_meta_comment(src, loc.comment, ns=ns)
+    name = ET.SubElement(src, tags['name'])
     name.text = loc.name
-    _ = ET.SubElement(src, f'{ns}obsPointSubType')
+    _ = ET.SubElement(src, tags['obsPointSubType'])
     if loc.point_type is not None:
         _.text = loc.point_type
     if loc.elevation is not None:
-        _ = ET.SubElement(src, f'{ns}validElevation')
-        _ = ET.SubElement(_, f'{ns}ElevationPosition', attrib={'uom': 'm'})
-        _ = ET.SubElement(_, f'{ns}position')
+        _ = ET.SubElement(src, tags['validElevation'])
+        _ = ET.SubElement(_, tags['ElevationPosition'], attrib={'uom': 'm'})
+        _ = ET.SubElement(_, tags['position'])
         _.text = str(int(loc.elevation))
     if loc.aspect is not None:
-        _ = ET.SubElement(src, f'{ns}validAspect')
-        _ = ET.SubElement(_, f'{ns}AspectPosition')
-        _ = ET.SubElement(_, f'{ns}position')
+        _ = ET.SubElement(src, tags['validAspect'])
+        _ = ET.SubElement(_, tags['AspectPosition'])
+        _ = ET.SubElement(_, tags['position'])
         _.text = str(int(loc.aspect))
     if loc.slope is not None:
-        _ = ET.SubElement(src, f'{ns}validSlopeAngle')
-        _ = ET.SubElement(_, f'{ns}SlopeAnglePosition', attrib={'uom': 'deg'})
-        _ = ET.SubElement(_, f'{ns}position')
+        _ = ET.SubElement(src, tags['validSlopeAngle'])
+        _ = ET.SubElement(_, tags['SlopeAnglePosition'], attrib={'uom': 'deg'})
+        _ = ET.SubElement(_, tags['position'])
         _.text = str(int(loc.slope))
     if loc.latitude is not None and loc.longitude is not None:
-        _ = ET.SubElement(src, f'{ns}pointLocation')
+        _ = ET.SubElement(src, tags['pointLocation'])
         _ = ET.SubElement(_, f'{ns_gml}Point', attrib={f'{ns_gml}id': _gen_id('pointID'),
                                                        'srsName': "urn:ogc:def:crs:OGC:1.3:CRS84",
                                                        'srsDimension': "2"})
         _ = ET.SubElement(_, f'{ns_gml}pos')
         _.text = f'{loc.latitude} {loc.longitude}'
     if loc.country is not None:
-        _ = ET.SubElement(src, f'{ns}country')
+        _ = ET.SubElement(src, tags['country'])
         _.text = loc.country
     if loc.region is not None:
-        _ = ET.SubElement(src, f'{ns}region')
+        _ = ET.SubElement(src, tags['region'])
         _.text = loc.region
 
-    if version >= "6.0.6":
+    if is_v606:
         env = snowprofile.environment
         # Solar Mask
-        sm = snowprofile.environment.solar_mask
+        sm = env.solar_mask
         if sm is not None:
-            e_sm = ET.SubElement(src, f'{ns}solarMask')
-            e_smm = ET.SubElement(e_sm, f'{ns}solarMaskMetaData')
+            e_sm = ET.SubElement(src, tags['solarMask'])
+            e_smm = ET.SubElement(e_sm, tags['solarMaskMetaData'])
             if env.solar_mask_comment is not None:
-                _ = ET.SubElement(e_smm, f'{ns}comment')
+                _ = ET.SubElement(e_smm, tags['comment'])
                 _.text = env.solar_mask_comment
-            _ = ET.SubElement(e_smm, f'{ns}methodOfMeas')
+            _ = ET.SubElement(e_smm, tags['methodOfMeas'])
             if env.solar_mask_method_of_measurement is None:
                 _.text = 'other'
             else:
                 _.text = env.solar_mask_method_of_measurement
             if env.solar_mask_uncertainty:
-                _ = ET.SubElement(e_smm, f'{ns}uncertaintyOfMeas')
-                _.text = "{:.12g}".format(env.solar_mask_uncertainty)
+                _add_scalar(e_smm, tags['uncertaintyOfMeas'], env.solar_mask_uncertainty)
             if env.solar_mask_quality:
-                _ = ET.SubElement(e_smm, f'{ns}qualityOfMeas')
+                _ = ET.SubElement(e_smm, tags['qualityOfMeas'])
                 _.text = env.solar_mask_quality
 
             for _, dataline in sm.data.iterrows():
-                e_ = ET.SubElement(e_sm, f'{ns}Data', attrib={'uom': 'deg'})
-                _ = ET.SubElement(e_, f'{ns}azimuth')
+                e_ = ET.SubElement(e_sm, tags['Data'], attrib={'uom': 'deg'})
+                _ = ET.SubElement(e_, tags['azimuth'])
                 _.text = str(int(dataline.azimuth))
-                _ = ET.SubElement(e_, f'{ns}elevation')
-                _.text = "{:.12g}".format(dataline.elevation)
+                _add_scalar(e_, tags['elevation'], dataline.elevation)
 
-            _append_additional_data(e_sm, snowprofile.environment.solar_mask_additional_data)
+            _append_additional_data(e_sm, env.solar_mask_additional_data)
 
         # obsPointEnvironment
-        e_ope = ET.SubElement(src, f'{ns}obsPointEnvironment')
+        e_ope = ET.SubElement(src, tags['obsPointEnvironment'])
         if env.bed_surface is not None:
-            _ = ET.SubElement(e_ope, f'{ns}bedSurface')
+            _ = ET.SubElement(e_ope, tags['bedSurface'])
             _.text = env.bed_surface
         if env.bed_surface_comment is not None:
-            _ = ET.SubElement(e_ope, f'{ns}bedSurfaceComment')
+            _ = ET.SubElement(e_ope, tags['bedSurfaceComment'])
             _.text = env.bed_surface_comment
         if env.litter_thickness is not None:
-            _ = ET.SubElement(e_ope, f'{ns}litterThickness', attrib={'uom': 'm'})
-            _.text = "{:.12g}".format(env.litter_thickness)
+            _add_scalar(e_ope, tags['litterThickness'], env.litter_thickness, uom='m')
         if env.ice_thickness is not None:
-            _ = ET.SubElement(e_ope, f'{ns}iceThickness', attrib={'uom': 'm'})
-            _.text = "{:.12g}".format(env.ice_thickness)
+            _add_scalar(e_ope, tags['iceThickness'], env.ice_thickness, uom='m')
         if env.low_vegetation_height is not None:
-            _ = ET.SubElement(e_ope, f'{ns}lowVegetationHeight', attrib={'uom': 'm'})
-            _.text = "{:.12g}".format(env.low_vegetation_height)
+            _add_scalar(e_ope, tags['lowVegetationHeight'], env.low_vegetation_height, uom='m')
         if env.LAI is not None:
-            _ = ET.SubElement(e_ope, f'{ns}lai', attrib={'uom': '1'})
-            _.text = "{:.12g}".format(env.LAI)
+            _add_scalar(e_ope, tags['lai'], env.LAI, uom='1')
         if env.forest_presence is not None:
-            _ = ET.SubElement(e_ope, f'{ns}forestPresence')
+            _ = ET.SubElement(e_ope, tags['forestPresence'])
             _.text = env.forest_presence
         if env.forest_presence_comment is not None:
-            _ = ET.SubElement(e_ope, f'{ns}forestComment')
+            _ = ET.SubElement(e_ope, tags['forestComment'])
             _.text = env.forest_presence_comment
         if env.sky_view_factor is not None:
-            _ = ET.SubElement(e_ope, f'{ns}skyViewFactor', attrib={'uom': '1'})
-            _.text = "{:.12g}".format(env.sky_view_factor)
+            _add_scalar(e_ope, tags['skyViewFactor'], env.sky_view_factor, uom='1')
         if env.tree_height is not None:
-            _ = ET.SubElement(e_ope, f'{ns}treeHeight', attrib={'uom': 'm'})
-            _.text = "{:.12g}".format(env.tree_height)
+            _add_scalar(e_ope, tags['treeHeight'], env.tree_height, uom='m')
 
     _append_additional_data(src, loc.additional_data, ns=ns)
 
     # snowProfileResultsOf
-    e_r = ET.SubElement(root, f'{ns}snowProfileResultsOf')
-    e_r = ET.SubElement(e_r, f'{ns}SnowProfileMeasurements', attrib={'dir': 'top down'})
+    e_r = ET.SubElement(root, tags['snowProfileResultsOf'])
+    e_r = ET.SubElement(e_r, tags['SnowProfileMeasurements'], attrib={'dir': 'top down'})
 
     if snowprofile.profile_comment is not None:
-        _ = ET.SubElement(e_r, f'{ns}metaData')
-        _ = ET.SubElement(_, f'{ns}comment')
-        _.text = snowprofile.profile_comment
+        _add_meta_comment(e_r, snowprofile.profile_comment, ns=ns)
 
     # profileDepth seem to be designed to be the observed depth rather than the total depth
     # if snowprofile.profile_depth is not None:
-    #     _ = ET.SubElement(r, f'{ns}profileDepth', attrib={'uom': 'cm'})
+    #     _ = ET.SubElement(r, tags['profileDepth'], attrib={'uom': 'cm'})
     #     _.text = str(float(snowprofile.profile_depth) * 100)
 
     # - Weather
-    e_weather = ET.SubElement(e_r, f'{ns}weatherCond')
+    e_weather = ET.SubElement(e_r, tags['weatherCond'])
     s_weather = snowprofile.weather
 
-    e_weather_metadata = ET.SubElement(e_weather, f'{ns}metaData')
-    e_weather_comment = ET.SubElement(e_weather_metadata, f'{ns}comment')
-    comment = ''
-    if s_weather.air_temperature_measurement_height is not None and version >= "6.0.6":
-        _ = ET.SubElement(e_weather_metadata, f'{ns}airTempMeasurementHeight', attrib={'uom': 'm'})
-        _.text = "{:.10g}".format(s_weather.air_temperature_measurement_height)
+    e_weather_metadata = ET.SubElement(e_weather, tags['metaData'])
+    e_weather_comment = ET.SubElement(e_weather_metadata, tags['comment'])
+    comment = []
+    if s_weather.air_temperature_measurement_height is not None and is_v606:
+        _add_scalar(e_weather_metadata, tags['airTempMeasurementHeight'], s_weather.air_temperature_measurement_height,
+                    uom='m', fmt='.10g')
     elif s_weather.air_temperature_measurement_height is not None:
-        comment += f'Height of the temperature measurement: {s_weather.air_temperature_measurement_height}m\n'
-    if s_weather.wind_measurement_height is not None and version >= "6.0.6":
-        _ = ET.SubElement(e_weather_metadata, f'{ns}windMeasurementHeight', attrib={'uom': 'm'})
-        _.text = "{:.10g}".format(s_weather.wind_measurement_height)
+        comment.append(f'Height of the temperature measurement: {s_weather.air_temperature_measurement_height}m')
+    if s_weather.wind_measurement_height is not None and is_v606:
+        _add_scalar(e_weather_metadata, tags['windMeasurementHeight'], s_weather.wind_measurement_height,
+                    uom='m', fmt='.10g')
     elif s_weather.wind_measurement_height is not None:
-        comment += f'Height of the wind measurement: {s_weather.wind_measurement_height}m\n'
-    if s_weather.comment is not None or len(comment) > 1:
-        if s_weather.comment is not None and len(comment) == 0:
-            comment = s_weather.comment
-        else:
-            comment = s_weather.comment + "\n\n" + comment
-        e_weather_comment.text = comment
+        comment.append(f'Height of the wind measurement: {s_weather.wind_measurement_height}m')
+    if s_weather.comment is not None or len(comment) > 0:
+        e_weather_comment.text = _merge_comment(s_weather.comment, comment)
 
     if s_weather.cloudiness is not None:
-        _ = ET.SubElement(e_weather, f'{ns}skyCond')
+        _ = ET.SubElement(e_weather, tags['skyCond'])
         _.text = s_weather.cloudiness
     if s_weather.precipitation is not None:
-        _ = ET.SubElement(e_weather, f'{ns}precipTI')
+        _ = ET.SubElement(e_weather, tags['precipTI'])
         _.text = s_weather.precipitation
     if s_weather.air_temperature is not None:
-        _ = ET.SubElement(e_weather, f'{ns}airTempPres', attrib={'uom': 'degC'})
-        _.text = "{:.10g}".format(s_weather.air_temperature)
-    if s_weather.air_humidity is not None and version >= "6.0.6":
-        _ = ET.SubElement(e_weather, f'{ns}airHumPres')
-        _.text = "{:.10g}".format(s_weather.air_humidity)
+        _add_scalar(e_weather, tags['airTempPres'], s_weather.air_temperature, uom='degC', fmt='.10g')
+    if s_weather.air_humidity is not None and is_v606:
+        _add_scalar(e_weather, tags['airHumPres'], s_weather.air_humidity, fmt='.10g')
     if s_weather.wind_speed is not None:
-        _ = ET.SubElement(e_weather, f'{ns}windSpd', attrib={'uom': 'ms-1'})
-        _.text = "{:.10g}".format(s_weather.wind_speed)
+        _add_scalar(e_weather, tags['windSpd'], s_weather.wind_speed, uom='ms-1', fmt='.10g')
     if s_weather.wind_direction is not None:
-        _ = ET.SubElement(e_weather, f'{ns}windDir')
-        _ = ET.SubElement(_, f'{ns}AspectPosition')
-        _ = ET.SubElement(_, f'{ns}position')
+        _ = ET.SubElement(e_weather, tags['windDir'])
+        _ = ET.SubElement(_, tags['AspectPosition'])
+        _ = ET.SubElement(_, tags['position'])
         _.text = str(int(s_weather.wind_direction))
     _append_additional_data(e_weather, s_weather.additional_data, ns=ns)
 
     # - Snowpack
-    e_snowpack = ET.SubElement(e_r, f'{ns}snowPackCond')
+    e_snowpack = ET.SubElement(e_r, tags['snowPackCond'])
     if snowprofile.profile_depth is not None or snowprofile.profile_swe is not None:
-        hs = ET.SubElement(e_snowpack, f'{ns}hS')
-        hsc = ET.SubElement(hs, f'{ns}Components')
+        hs = ET.SubElement(e_snowpack, tags['hS'])
+        hsc = ET.SubElement(hs, tags['Components'])
         if snowprofile.profile_depth is not None:
-            _ = ET.SubElement(hsc, f'{ns}height', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(snowprofile.profile_depth * 100)
+            _add_scalar(hsc, tags['height'], snowprofile.profile_depth, uom='cm', factor=100)
         if snowprofile.profile_swe is not None:
-            _ = ET.SubElement(hsc, f'{ns}waterEquivalent', attrib={'uom': 'kgm-2'})
-            _.text = "{:.12g}".format(snowprofile.profile_swe)
+            _add_scalar(hsc, tags['waterEquivalent'], snowprofile.profile_swe, uom='kgm-2')
     if (snowprofile.profile_depth_std is not None or snowprofile.profile_swe_std is not None):
-        if version >= "6.0.6":
-            hs = ET.SubElement(e_snowpack, f'{ns}hSVariability')
-            hsc = ET.SubElement(hs, f'{ns}Components')
+        if is_v606:
+            hs = ET.SubElement(e_snowpack, tags['hSVariability'])
+            hsc = ET.SubElement(hs, tags['Components'])
             if snowprofile.profile_depth_std is not None:
-                _ = ET.SubElement(hsc, f'{ns}height', attrib={'uom': 'cm'})
-                _.text = "{:.12g}".format(snowprofile.profile_depth_std * 100)
+                _add_scalar(hsc, tags['height'], snowprofile.profile_depth_std, uom='cm', factor=100)
             if snowprofile.profile_swe_std is not None:
-                _ = ET.SubElement(hsc, f'{ns}waterEquivalent', attrib={'uom': 'kgm-2'})
-                _.text = "{:.12g}".format(snowprofile.profile_swe_std)
+                _add_scalar(hsc, tags['waterEquivalent'], snowprofile.profile_swe_std, uom='kgm-2')
         else:
             logging.warning('Caaml 6 < 6.0.6 does not support profile_depth_std and profile_swe_std.')
     if snowprofile.new_snow_24_depth is not None or snowprofile.new_snow_24_swe is not None:
-        hs = ET.SubElement(e_snowpack, f'{ns}hN24')
-        hsc = ET.SubElement(hs, f'{ns}Components')
+        hs = ET.SubElement(e_snowpack, tags['hN24'])
+        hsc = ET.SubElement(hs, tags['Components'])
         if snowprofile.new_snow_24_depth is not None:
-            _ = ET.SubElement(hsc, f'{ns}height', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(snowprofile.new_snow_24_depth * 100)
+            _add_scalar(hsc, tags['height'], snowprofile.new_snow_24_depth, uom='cm', factor=100)
         if snowprofile.new_snow_24_swe is not None:
-            _ = ET.SubElement(hsc, f'{ns}waterEquivalent', attrib={'uom': 'kgm-2'})
-            _.text = "{:.12g}".format(snowprofile.new_snow_24_swe)
+            _add_scalar(hsc, tags['waterEquivalent'], snowprofile.new_snow_24_swe, uom='kgm-2')
     if (snowprofile.new_snow_24_depth_std is not None or snowprofile.new_snow_24_swe_std is not None):
-        hs = ET.SubElement(e_snowpack, f'{ns}hIN',
+        hs = ET.SubElement(e_snowpack, tags['hIN'],
                            attrib={'dateTimeCleared': snowprofile.time.record_time.isoformat(timespec='seconds')})
-        hsc = ET.SubElement(hs, f'{ns}Components')
+        hsc = ET.SubElement(hs, tags['Components'])
         if snowprofile.new_snow_24_depth_std is not None:
-            _ = ET.SubElement(hsc, f'{ns}height', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(snowprofile.new_snow_24_depth_std * 100)
+            _add_scalar(hsc, tags['height'], snowprofile.new_snow_24_depth_std, uom='cm', factor=100)
         if snowprofile.new_snow_24_swe_std is not None:
-            _ = ET.SubElement(hsc, f'{ns}waterEquivalent', attrib={'uom': 'kgm-2'})
-            _.text = "{:.12g}".format(snowprofile.new_snow_24_swe_std)
+            _add_scalar(hsc, tags['waterEquivalent'], snowprofile.new_snow_24_swe_std, uom='kgm-2')
     if snowprofile.snow_transport is not None:
-        if version >= "6.0.6":
-            _ = ET.SubElement(e_snowpack, f'{ns}snowTransport')
+        if is_v606:
+            _ = ET.SubElement(e_snowpack, tags['snowTransport'])
             _.text = snowprofile.snow_transport
         else:
             logging.warning('Caaml 6 < 6.0.6 does not support snow transport data.')
     if snowprofile.snow_transport_occurence_24 is not None:
-        if version >= "6.0.6":
-            _ = ET.SubElement(e_snowpack, f'{ns}snowTransportOccurrence24')
-            _.text = "{:.12g}".format(snowprofile.snow_transport_occurence_24)
+        if is_v606:
+            _add_scalar(e_snowpack, tags['snowTransportOccurrence24'], snowprofile.snow_transport_occurence_24)
         else:
             logging.warning('Caaml 6 < 6.0.6 does not support snow transport data.')
 
     #  - Surface characterization
-    e_surf = ET.SubElement(e_r, f'{ns}surfCond')
+    e_surf = ET.SubElement(e_r, tags['surfCond'])
     s_surf = snowprofile.surface_conditions
-    comment = ''
-    _ = ET.SubElement(e_surf, f'{ns}metaData')
-    e_surf_comment = ET.SubElement(_, f'{ns}comment')
+    comment = []
+    _ = ET.SubElement(e_surf, tags['metaData'])
+    e_surf_comment = ET.SubElement(_, tags['comment'])
 
-    _ = ET.SubElement(e_surf, f'{ns}surfFeatures')
-    e_surff = ET.SubElement(_, f'{ns}Components')
-    _ = ET.SubElement(e_surff, f'{ns}surfRoughness')
+    _ = ET.SubElement(e_surf, tags['surfFeatures'])
+    e_surff = ET.SubElement(_, tags['Components'])
+    _ = ET.SubElement(e_surff, tags['surfRoughness'])
     if s_surf.surface_roughness is not None:
         _.text = s_surf.surface_roughness
     else:
         _.text = 'unknown'
     if s_surf.surface_wind_features is not None:
-        if version >= "6.0.6":
-            _ = ET.SubElement(e_surff, f'{ns}surfWindFeatures')
+        if is_v606:
+            _ = ET.SubElement(e_surff, tags['surfWindFeatures'])
             _.text = s_surf.surface_wind_features
         else:
-            comment += f'Wind surface features: {s_surf.surface_wind_features}\n'
+            comment.append(f'Wind surface features: {s_surf.surface_wind_features}')
     if s_surf.surface_melt_rain_features is not None:
-        if version >= "6.0.6":
-            _ = ET.SubElement(e_surff, f'{ns}surfMeltRainFeatures')
+        if is_v606:
+            _ = ET.SubElement(e_surff, tags['surfMeltRainFeatures'])
             _.text = s_surf.surface_melt_rain_features
         else:
-            comment += f'Melt and rain surface features: {s_surf.surface_melt_rain_features}\n'
+            comment.append(f'Melt and rain surface features: {s_surf.surface_melt_rain_features}')
 
     if s_surf.surface_features_amplitude is not None:
         if s_surf.surface_features_amplitude_min is not None or s_surf.surface_features_amplitude_max is not None:
             logging.warning('CAAML6 could not store both surface_feature amplitude and min/max of amplitude.')
-        _ = ET.SubElement(e_surff, f'{ns}validAmplitude')
-        _ = ET.SubElement(_, f'{ns}AmplitudePosition', attrib={'uom': 'cm'})
-        _ = ET.SubElement(_, f'{ns}position')
-        _.text = "{:.12g}".format(s_surf.surface_features_amplitude * 100)
+        _ = ET.SubElement(e_surff, tags['validAmplitude'])
+        _ = ET.SubElement(_, tags['AmplitudePosition'], attrib={'uom': 'cm'})
+        _ = ET.SubElement(_, tags['position'])
+        _.text = format(s_surf.surface_features_amplitude * 100, '.12g')
     elif s_surf.surface_features_amplitude_min is not None and s_surf.surface_features_amplitude_max is not None:
-        _ = ET.SubElement(e_surff, f'{ns}validAmplitude')
-        _r = ET.SubElement(_, f'{ns}AmplitudeRange', attrib={'uom': 'cm'})
-        _ = ET.SubElement(_r, f'{ns}beginPosition')
-        _.text = "{:.12g}".format(s_surf.surface_features_amplitude_min * 100)
-        _ = ET.SubElement(_r, f'{ns}endPosition')
-        _.text = "{:.12g}".format(s_surf.surface_features_amplitude_max * 100)
+        _ = ET.SubElement(e_surff, tags['validAmplitude'])
+        _r = ET.SubElement(_, tags['AmplitudeRange'], attrib={'uom': 'cm'})
+        _ = ET.SubElement(_r, tags['beginPosition'])
+        _.text = format(s_surf.surface_features_amplitude_min * 100, '.12g')
+        _ = ET.SubElement(_r, tags['endPosition'])
+        _.text = format(s_surf.surface_features_amplitude_max * 100, '.12g')
 
     if s_surf.surface_features_wavelength is not None:
         if s_surf.surface_features_wavelength_min is not None or s_surf.surface_features_wavelength_max is not None:
             logging.warning('CAAML6 could not store both surface_feature wavelength and min/max of wavelength.')
-        _ = ET.SubElement(e_surff, f'{ns}validWavelength')
-        _ = ET.SubElement(_, f'{ns}WavelengthPosition', attrib={'uom': 'm'})
-        _ = ET.SubElement(_, f'{ns}position')
-        _.text = "{:.12g}".format(s_surf.surface_features_wavelength)
+        _ = ET.SubElement(e_surff, tags['validWavelength'])
+        _ = ET.SubElement(_, tags['WavelengthPosition'], attrib={'uom': 'm'})
+        _add_scalar(_, tags['position'], s_surf.surface_features_wavelength)
     elif s_surf.surface_features_wavelength_min is not None and s_surf.surface_features_wavelength_max is not None:
-        _ = ET.SubElement(e_surff, f'{ns}validWavelength')
-        _r = ET.SubElement(_, f'{ns}WavelengthRange', attrib={'uom': 'm'})
-        _ = ET.SubElement(_r, f'{ns}beginPosition')
-        _.text = "{:.12g}".format(s_surf.surface_features_wavelength_min)
-        _ = ET.SubElement(_r, f'{ns}endPosition')
-        _.text = "{:.12g}".format(s_surf.surface_features_wavelength_max)
+        _ = ET.SubElement(e_surff, tags['validWavelength'])
+        _r = ET.SubElement(_, tags['WavelengthRange'], attrib={'uom': 'm'})
+        _add_scalar(_r, tags['beginPosition'], s_surf.surface_features_wavelength_min)
+        _add_scalar(_r, tags['endPosition'], s_surf.surface_features_wavelength_max)
 
     if s_surf.surface_features_aspect is not None:
-        _ = ET.SubElement(e_surff, f'{ns}validAspect')
-        _ = ET.SubElement(_, f'{ns}AspectPosition')
-        _ = ET.SubElement(_, f'{ns}position')
+        _ = ET.SubElement(e_surff, tags['validAspect'])
+        _ = ET.SubElement(_, tags['AspectPosition'])
+        _ = ET.SubElement(_, tags['position'])
         _.text = str(int(s_surf.surface_features_aspect))
 
-    if version >= "6.0.6":
-        _ = ET.SubElement(e_surff, f'{ns}lapPresence')
+    if is_v606:
+        _ = ET.SubElement(e_surff, tags['lapPresence'])
         if s_surf.lap_presence is None:
             _.text = 'unknown'
         else:
             _.text = s_surf.lap_presence
 
         if s_surf.surface_temperature is not None:
-            _surftemp = ET.SubElement(e_surff, f'{ns}surfTemp')
+            _surftemp = ET.SubElement(e_surff, tags['surfTemp'])
             if s_surf.surface_temperature_measurement_method is not None:
-                _ = ET.SubElement(_surftemp, f'{ns}methodOfMeas')
+                _ = ET.SubElement(_surftemp, tags['methodOfMeas'])
                 _.text = s_surf.surface_temperature_measurement_method
-            _ = ET.SubElement(_surftemp, f'{ns}data', attrib={'uom': 'degC'})
+            _ = ET.SubElement(_surftemp, tags['data'], attrib={'uom': 'degC'})
             _.text = str(s_surf.surface_temperature)
     else:
         if s_surf.lap_presence is not None:
-            comment += f'LAP presence: {s_surf.lap_presence}\n'
+            comment.append(f'LAP presence: {s_surf.lap_presence}')
         if s_surf.surface_temperature is not None:
-            comment += f'Surface temperature: {s_surf.surface_temperature}\n'
+            comment.append(f'Surface temperature: {s_surf.surface_temperature}')
         if s_surf.surface_temperature_measurement_method is not None:
-            comment += f'Surface temperature measurement method: {s_surf.surface_temperature_measurement_method}\n'
+            comment.append(f'Surface temperature measurement method: {s_surf.surface_temperature_measurement_method}')
 
-    if (s_surf.surface_albedo is not None or s_surf.spectral_albedo is not None) and version >= '6.0.6':
-        e_albedo = ET.SubElement(e_surff, f'{ns}surfAlbedo')
+    if (s_surf.surface_albedo is not None or s_surf.spectral_albedo is not None) and is_v606:
+        e_albedo = ET.SubElement(e_surff, tags['surfAlbedo'])
         if s_surf.surface_albedo is not None:
-            e_albedo_broadband = ET.SubElement(e_albedo, f'{ns}albedo')
-            _ = ET.SubElement(e_albedo_broadband, f'{ns}albedoMeasurement')
-            _.text = "{:.12g}".format(s_surf.surface_albedo)
+            e_albedo_broadband = ET.SubElement(e_albedo, tags['albedo'])
+            _add_scalar(e_albedo_broadband, tags['albedoMeasurement'], s_surf.surface_albedo)
             if s_surf.surface_albedo_comment is not None:
-                _ = ET.SubElement(e_albedo_broadband, f'{ns}metaData')
-                _ = ET.SubElement(_, f'{ns}comment')
-                _.text = s_surf.surface_albedo_comment
+                _add_meta_comment(e_albedo_broadband, s_surf.surface_albedo_comment, ns=ns)
         if s_surf.spectral_albedo is not None:
-            e_albedo_spectral = ET.SubElement(e_albedo, f'{ns}spectralAlbedo')
+            e_albedo_spectral = ET.SubElement(e_albedo, tags['spectralAlbedo'])
             logging.warning('Spectral albedo not yet implemented for CAAML6 output')
             for _, dataline in s_surf.spectral_albedo.data.iterrows():
-                e_sam = ET.SubElement(e_albedo_spectral, f'{ns}spectralAlbedoMeasurement')
+                e_sam = ET.SubElement(e_albedo_spectral, tags['spectralAlbedoMeasurement'])
 
-                _ = ET.SubElement(e_sam, f'{ns}minWaveLength', attrib={'uom': 'nm'})
-                _.text = "{:.12g}".format(dataline.min_wavelength)
+                _add_scalar(e_sam, tags['minWaveLength'], dataline.min_wavelength, uom='nm')
 
-                _ = ET.SubElement(e_sam, f'{ns}maxWaveLength', attrib={'uom': 'nm'})
-                _.text = "{:.12g}".format(dataline.max_wavelength)
+                _add_scalar(e_sam, tags['maxWaveLength'], dataline.max_wavelength, uom='nm')
 
                 attrib = {}
-                if 'uncertainty' in dataline and not np.isnan(dataline.uncertainty) and version >= '6.0.6':
-                    attrib['uncertainty'] = "{:.12g}".format(dataline.uncertainty)
-                if 'quality' in dataline and dataline.quality is not None and version >= '6.0.6':
+                if 'uncertainty' in dataline and not np.isnan(dataline.uncertainty) and is_v606:
+                    attrib['uncertainty'] = format(dataline.uncertainty, '.12g')
+                if 'quality' in dataline and dataline.quality is not None and is_v606:
                     attrib['quality'] = dataline.quality
-                _ = ET.SubElement(e_sam, f'{ns}albedo', attrib=attrib)
-                _.text = "{:.12g}".format(dataline.albedo)
+                _ = ET.SubElement(e_sam, tags['albedo'], attrib=attrib)
+                _.text = format(dataline.albedo, '.12g')
 
             if s_surf.spectral_albedo.comment is not None:
-                _ = ET.SubElement(e_albedo_spectral, f'{ns}metaData')
-                _ = ET.SubElement(_, f'{ns}comment')
-                _.text = s_surf.spectral_albedo.comment
+                _add_meta_comment(e_albedo_spectral, s_surf.spectral_albedo.comment, ns=ns)
 
 
     if s_surf.comment is not None or len(comment) > 0:
-        if s_surf.comment is not None and len(comment) == 0:
-            comment = s_surf.comment
-        elif s_surf.comment is not None:
-            comment = s_surf.comment + "\n\n" + comment
-        e_surf_comment.text = comment
+        e_surf_comment.text = _merge_comment(s_surf.comment, comment)
 
     if s_surf.penetration_ram is not None:
-        _ = ET.SubElement(e_surf, f'{ns}penetrationRam', attrib={'uom': 'cm'})
-        _.text = "{:.12g}".format(s_surf.penetration_ram * 100)
+        _add_scalar(e_surf, tags['penetrationRam'], s_surf.penetration_ram, uom='cm', factor=100)
     if s_surf.penetration_foot is not None:
-        _ = ET.SubElement(e_surf, f'{ns}penetrationFoot', attrib={'uom': 'cm'})
-        _.text = "{:.12g}".format(s_surf.penetration_foot * 100)
+        _add_scalar(e_surf, tags['penetrationFoot'], s_surf.penetration_foot, uom='cm', factor=100)
     if s_surf.penetration_ski is not None:
-        _ = ET.SubElement(e_surf, f'{ns}penetrationSki', attrib={'uom': 'cm'})
-        _.text = "{:.12g}".format(s_surf.penetration_ski * 100)
+        _add_scalar(e_surf, tags['penetrationSki'], s_surf.penetration_ski, uom='cm', factor=100)
 
     _append_additional_data(e_surf, s_surf.additional_data)
 
     # - Profiles
     _insert_stratigrpahy_profile(e_r, snowprofile.stratigraphy_profile, config=config)
 
-    if version >= "6.0.6":
+    if is_v606:
         for profile in snowprofile.temperature_profiles:
             _insert_temperature_profile(e_r, profile, config=config)
     else:
@@ -548,7 +506,7 @@ def write_caaml6_xml(snowprofile, filename, version='6.0.5', indent=False):
         _insert_impurity_profile(e_r, profile, config=config)
 
     if len(snowprofile.stability_tests) > 0:
-        e_stb = ET.SubElement(e_r, f'{ns}stbTests')
+        e_stb = ET.SubElement(e_r, tags['stbTests'])
         for stbt in snowprofile.stability_tests:
             _insert_stb_test(e_stb, stbt, config=config)
 
@@ -563,10 +521,10 @@ def write_caaml6_xml(snowprofile, filename, version='6.0.5', indent=False):
 
     # application  and application_version (optional)
     if snowprofile.application is not None:
-        _ = ET.SubElement(root, f'{ns}application')
+        _ = ET.SubElement(root, tags['application'])
         _.text = snowprofile.application
     if snowprofile.application_version is not None:
-        _ = ET.SubElement(root, f'{ns}applicationVersion')
+        _ = ET.SubElement(root, tags['applicationVersion'])
         _.text = snowprofile.application_version
 
     _append_additional_data(root, snowprofile.additional_data, ns=ns)
@@ -586,19 +544,78 @@ def write_caaml6_xml(snowprofile, filename, version='6.0.5', indent=False):
                xml_declaration=True)
 
 
+def _version_tuple(version):
+    """
+    Version string (e.g. '6.0.6') as a tuple of integers, for comparisons that do not depend
+    on the number of digits.
+    """
+    return tuple(int(x) for x in version.split('.'))
+
+
+class _Tags(dict):
+    """
+    Cache of the namespace-qualified tags (Clark notation), e.g.
+    ``tags['Layer'] == '{http://caaml.org/Schemas/SnowProfileIACS/v6.0.4}Layer'``.
+
+    Avoid formatting the same tag again and again in the layer loops.
+    """
+    def __init__(self, ns):
+        super().__init__()
+        self.ns = ns
+
+    def __missing__(self, name):
+        tag = self[name] = self.ns + name
+        return tag
+
+
+def _add_meta_comment(parent, text, ns=''):
+    """
+    Add a metaData element containing a comment to parent and return the metaData element.
+    """
+    e_md = ET.SubElement(parent, f'{ns}metaData')
+    ET.SubElement(e_md, f'{ns}comment').text = text
+    return e_md
+
+
+def _add_scalar(parent, tag, value, uom=None, factor=1, fmt='.12g'):
+    """
+    Add a tag element to parent containing the numeric value (multiplied by factor) formatted with fmt.
+
+    Nothing is done if value is None.
+    """
+    if value is None:
+        return None
+    e = ET.SubElement(parent, tag, attrib={'uom': uom} if uom is not None else {})
+    e.text = format(value * factor, fmt)
+    return e
+
+
 def _append_additional_data(element, data, ns=''):
     if data is None or data.data is None:
         return None
     # TODO: tbd  <24-02-25, Léo Viallon-Galinier> #
 
 
+def _merge_comment(comment, lines):
+    """
+    Text of a comment element: the user comment followed by the lines of information
+    that could not be stored elsewhere in the selected CAAML version.
+    """
+    extra = ''.join(f'{line}\n' for line in lines)
+    if comment is None:
+        return extra
+    elif len(extra) == 0:
+        return comment
+    return comment + '\n\n' + extra
+
+
 def _gen_common_attrib(s, config={}):
     attrib = {}
-    if s.id is not None and config['version'] >= '6.0.6':
+    if s.id is not None and config['is_v606']:
         attrib['id'] = config['_gen_id'](s.id)
-    if len(s.related_profiles) > 0 and config['version'] >= '6.0.6':
+    if len(s.related_profiles) > 0 and config['is_v606']:
         attrib['relatedProfiles'] = ' '.join(s.related_profiles)
-    if s.name is not None and config['version'] >= '6.0.6':
+    if s.name is not None and config['is_v606']:
         attrib['name'] = s.name
     return attrib
 
@@ -607,49 +624,49 @@ def _gen_common_metadata(e, s, config={}, additional_metadata = [], name='metaDa
     """
     Metadata handler common to all profiles.
     """
-    ns = config['ns']
-    comment = ''
+    tags = config['tags']
+    comment = []
 
-    e_md = ET.SubElement(e, f'{ns}{name}')
-    e_comment = ET.SubElement(e_md, f'{ns}comment')
+    e_md = ET.SubElement(e, tags[name])
+    e_comment = ET.SubElement(e_md, tags['comment'])
 
-    if config['version'] >= "6.0.6":
+    if config['is_v606']:
         if s.record_period is not None and s.record_period[0] is not None and s.record_period[1] is not None:
-            e_record_time = ET.SubElement(e_md, f'{ns}recordTime')
-            _ = ET.SubElement(e_record_time, f'{ns}TimePeriod')
-            begin = ET.SubElement(_, f'{ns}beginPosition')
+            e_record_time = ET.SubElement(e_md, tags['recordTime'])
+            _ = ET.SubElement(e_record_time, tags['TimePeriod'])
+            begin = ET.SubElement(_, tags['beginPosition'])
             begin.text = s.record_period[0].isoformat()
-            end = ET.SubElement(_, f'{ns}endPosition')
+            end = ET.SubElement(_, tags['endPosition'])
             end.text = s.record_period[1].isoformat()
         elif s.record_time is not None:
-            e_record_time = ET.SubElement(e_md, f'{ns}recordTime')
-            _ = ET.SubElement(e_record_time, f'{ns}TimeInstant')
-            _ = ET.SubElement(_, f'{ns}timePosition')
+            e_record_time = ET.SubElement(e_md, tags['recordTime'])
+            _ = ET.SubElement(e_record_time, tags['TimeInstant'])
+            _ = ET.SubElement(_, tags['timePosition'])
             _.text = s.record_time.isoformat()
     else:
         if s.record_time is not None:
-            comment += f"Record time: {s.record_time.isoformat()}\n"
+            comment.append(f"Record time: {s.record_time.isoformat()}")
         if s.record_period is not None and s.record_period[0] is not None and s.record_period[1] is not None:
-            comment += f"Record period: {s.record_period[0].isoformat()}-{s.record_period[1].isoformat()}\n"
+            comment.append(f"Record period: {s.record_period[0].isoformat()}-{s.record_period[1].isoformat()}")
 
     e_hs = None
     if s.profile_depth is not None and s.profile_depth != config['profile_depth']:
-        if config['version'] >= "6.0.6":
-            e_hs = ET.SubElement(e_md, f"{ns}hS")
-            e_hs = ET.SubElement(e_hs, f"{ns}Components")
-            _ = ET.SubElement(e_hs, f"{ns}height", attrib={'uom': 'cm'})
+        if config['is_v606']:
+            e_hs = ET.SubElement(e_md, tags['hS'])
+            e_hs = ET.SubElement(e_hs, tags['Components'])
+            _ = ET.SubElement(e_hs, tags['height'], attrib={'uom': 'cm'})
             _.text = str(s.profile_depth * 100)
         else:
-            comment += f"Profile depth: {s.profile_depth}m\n"
+            comment.append(f"Profile depth: {s.profile_depth}m")
     if s.profile_swe is not None and s.profile_swe != config['profile_swe']:
-        if config['version'] >= "6.0.6":
+        if config['is_v606']:
             if e_hs is None:
-                e_hs = ET.SubElement(e_md, f"{ns}hS")
-                e_hs = ET.SubElement(e_hs, f"{ns}Components")
-            _ = ET.SubElement(e_hs, f"{ns}waterEquivalent", attrib={'uom': 'kgm-2'})
+                e_hs = ET.SubElement(e_md, tags['hS'])
+                e_hs = ET.SubElement(e_hs, tags['Components'])
+            _ = ET.SubElement(e_hs, tags['waterEquivalent'], attrib={'uom': 'kgm-2'})
             _.text = str(s.profile_swe)
         else:
-            comment += f"Profile SWE: {s.profile_swe}m\n"
+            comment.append(f"Profile SWE: {s.profile_swe}m")
 
     for elem in additional_metadata:
         value = elem['value']
@@ -660,9 +677,9 @@ def _gen_common_metadata(e, s, config={}, additional_metadata = [], name='metaDa
             continue
 
         # Check version
-        if 'min_version' in elem and elem['min_version'] > config['version']:
+        if 'min_version' in elem and _version_tuple(elem['min_version']) > config['version_tuple']:
             if 'comment_title' in elem:
-                comment += f'{elem["comment_title"]}: {value}\n'
+                comment.append(f'{elem["comment_title"]}: {value}')
             continue
 
         # Get the value and pre-process to get a string
@@ -676,92 +693,154 @@ def _gen_common_metadata(e, s, config={}, additional_metadata = [], name='metaDa
         if 'factor' in elem:
             value = value * elem['factor']
         if isinstance(value, float):
-            value = "{:.12g}".format(value)
+            value = format(value, '.12g')
         elif not isinstance(value, str):
             value = str(value)
 
         # Write the metadata
-        _ = ET.SubElement(e_md, f'{ns}{key}',
+        _ = ET.SubElement(e_md, tags[key],
                           attrib=elem['attrib'] if 'attrib' in elem and elem['attrib'] is not None else {})
         _.text = value
 
     if s.comment is not None or len(comment) > 0:
-        if s.comment is not None and len(comment) == 0:
-            comment = s.comment
-        elif s.comment is not None:
-            comment = s.comment + "\n\n" + comment
-        e_comment.text = comment
+        e_comment.text = _merge_comment(s.comment, comment)
 
     return e_md
 
 
+def _depth_cm(data, profile_depth, profile_name, key='top_height', label='Top height'):
+    """
+    Depth (cm) of the top of each layer (or of each point with key='height') from the heights (m),
+    as a list of formatted strings.
+
+    Raise a ValueError if a layer is above the profile depth.
+    """
+    height = data[key].to_numpy(dtype='float')
+    depth = profile_depth - height
+    above = depth < 0
+    if above.any():
+        raise ValueError(f'{label} ({height[above.argmax()]}m) > profile depth ({profile_depth}m) '
+                         f'in {profile_name})')
+    return _format_values(depth * 100)
+
+
+def _column_scaled(data, key, factor):
+    """
+    Values of a numeric column multiplied by factor (unit conversion) as formatted strings and nan mask,
+    both as lists for fast access in the layer loops.
+    """
+    values = data[key].to_numpy(dtype='float')
+    return _format_values(values * factor), np.isnan(values).tolist()
+
+
+def _format_values(values, fmt='%.12g'):
+    """
+    Format all the values of a numpy array at once (same output as format(value, '.12g')).
+    """
+    return [fmt % v for v in values.tolist()]
+
+
+def _column_isoformat(data, key):
+    """
+    ISO formatted strings of a column of dates, as a list (None for missing values).
+
+    Return None if the column does not exist. Dates are often shared between layers,
+    each distinct date is formatted only once.
+    """
+    if key not in data.columns:
+        return None
+    column = data[key]
+    cache = {}
+    result = []
+    for value, missing in zip(column.tolist(), column.isna().tolist()):
+        if missing:
+            result.append(None)
+            continue
+        r = cache.get(value)
+        if r is None:
+            r = cache[value] = value.isoformat()
+        result.append(r)
+    return result
+
+
 def _insert_stratigrpahy_profile(e_r, s_strat, config):
     if s_strat is None:
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_strat.profile_depth if s_strat.profile_depth is not None else config['profile_depth']
 
-    e_s = ET.SubElement(e_r, f'{ns}stratProfile',
+    e_s = ET.SubElement(e_r, tags['stratProfile'],
                         attrib=_gen_common_attrib(s_strat, config=config))
     e_md = _gen_common_metadata(e_s, s_strat, config=config, name='stratMetaData')
 
-    # Layer loop
-    for _, layer in s_strat.data.iterrows():
-        e_layer = ET.SubElement(e_s, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in statigraphy profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    # Layer loop (unit conversions are done once on the whole columns)
+    data = s_strat.data
+    columns = data.columns
+    depth_top = _depth_cm(data, profile_depth, 'statigraphy profile')
+    thickness, thickness_isnan = _column_scaled(data, 'thickness', 100)
+    grain_size, _ = _column_scaled(data, 'grain_size', 1e3)
+    has_grain_size_max = 'grain_size_max' in columns
+    if has_grain_size_max:
+        grain_size_max, grain_size_max_isnan = _column_scaled(data, 'grain_size_max', 1e3)
+    has_loc = 'loc' in columns
+    has_comment = 'comment' in columns
+    has_additional_data = 'additional_data' in columns
+    formation_time = _column_isoformat(data, 'formation_time')
+    formation_period_begin = _column_isoformat(data, 'formation_period_begin')
+    formation_period_end = _column_isoformat(data, 'formation_period_end')
+
+    for i, layer in enumerate(data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_s, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         if layer.grain_1 is not None:
-            _ = ET.SubElement(e_layer, f'{ns}grainFormPrimary')
+            _ = ET.SubElement(e_layer, tags['grainFormPrimary'])
             _.text = layer.grain_1
         if layer.grain_1 is not None and layer.grain_2 is not None:
-            _ = ET.SubElement(e_layer, f'{ns}grainFormSecondary')
+            _ = ET.SubElement(e_layer, tags['grainFormSecondary'])
             _.text = layer.grain_2
         if layer.grain_size is not None:
-            _ = ET.SubElement(e_layer, f'{ns}grainSize', attrib={'uom': 'mm'})
-            _c = ET.SubElement(_, f'{ns}Components')
-            _ = ET.SubElement(_c, f'{ns}avg')
-            _.text = "{:.12g}".format(layer.grain_size * 1e3)
-            if 'grain_size_max' in layer and not np.isnan(layer.grain_size_max):
-                _ = ET.SubElement(_c, f'{ns}avgMax')
-                _.text = "{:.12g}".format(layer.grain_size_max * 1e3)
+            _ = ET.SubElement(e_layer, tags['grainSize'], attrib={'uom': 'mm'})
+            _c = ET.SubElement(_, tags['Components'])
+            _ = ET.SubElement(_c, tags['avg'])
+            _.text = grain_size[i]
+            if has_grain_size_max and not grain_size_max_isnan[i]:
+                _ = ET.SubElement(_c, tags['avgMax'])
+                _.text = grain_size_max[i]
         if layer.hardness is not None:
-            _ = ET.SubElement(e_layer, f'{ns}hardness', attrib={'uom': ''})
+            _ = ET.SubElement(e_layer, tags['hardness'], attrib={'uom': ''})
             _.text = layer.hardness
         if layer.wetness is not None:
-            _ = ET.SubElement(e_layer, f'{ns}wetness', attrib={'uom': ''})
+            _ = ET.SubElement(e_layer, tags['wetness'], attrib={'uom': ''})
             _.text = layer.wetness
-        if 'loc' in layer and layer.loc is not None:
-            _ = ET.SubElement(e_layer, f'{ns}layerOfConcern')
+        if has_loc and layer.loc is not None:
+            _ = ET.SubElement(e_layer, tags['layerOfConcern'])
             _.text = layer.loc
         _md = None
-        if ('comment' in layer and layer.comment is not None and len(layer.comment) > 0):
-            _md = ET.SubElement(e_layer, f'{ns}metaData')
-            _ = ET.SubElement(_md, f'{ns}comment')
-            _.text = str(layer.comment)
-        if 'additional_data' in layer and layer.additional_data is not None:
+        if has_comment and layer.comment is not None and len(layer.comment) > 0:
+            _md = _add_meta_comment(e_layer, str(layer.comment), ns=ns)
+        if has_additional_data and layer.additional_data is not None:
             if _md is None:
-                _md = ET.SubElement(e_layer, f'{ns}metaData')
+                _md = ET.SubElement(e_layer, tags['metaData'])
                 _append_additional_data(_md, layer.additional_data, ns=ns)
-        if 'formation_time' in layer and layer.formation_time is not None:
-            _ = ET.SubElement(e_layer, f'{ns}validFormationTime')
-            _t = ET.SubElement(_, f'{ns}TimeInstant')
-            _ = ET.SubElement(_t, f'{ns}timePosition')
-            _.text = layer.formation_time.isoformat()
-        elif ('formation_period_begin' in layer and 'formation_period_end' in layer
-              and layer.formation_period_begin is not None and layer.formation_period_end is not None):
-            _ = ET.SubElement(e_layer, f'{ns}validFormationTime')
-            _t = ET.SubElement(_, f'{ns}TimePeriod')
-            _ = ET.SubElement(_t, f'{ns}beginPosition')
-            _.text = layer.formation_period_begin.isoformat()
-            _ = ET.SubElement(_t, f'{ns}endPosition')
-            _.text = layer.formation_period_end.isoformat()
+        if formation_time is not None and formation_time[i] is not None:
+            _ = ET.SubElement(e_layer, tags['validFormationTime'])
+            _t = ET.SubElement(_, tags['TimeInstant'])
+            _ = ET.SubElement(_t, tags['timePosition'])
+            _.text = formation_time[i]
+        elif (formation_period_begin is not None and formation_period_end is not None
+              and formation_period_begin[i] is not None and formation_period_end[i] is not None):
+            _ = ET.SubElement(e_layer, tags['validFormationTime'])
+            _t = ET.SubElement(_, tags['TimePeriod'])
+            _ = ET.SubElement(_t, tags['beginPosition'])
+            _.text = formation_period_begin[i]
+            _ = ET.SubElement(_t, tags['endPosition'])
+            _.text = formation_period_end[i]
 
     _append_additional_data(e_s, s_strat.additional_data, ns=ns)
 
@@ -774,10 +853,12 @@ def _insert_density_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}densityProfile',
+    e_p = ET.SubElement(e_r, tags['densityProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -796,27 +877,33 @@ def _insert_density_profile(e_r, s_p, config):
             {'value': s_p.probed_thickness, 'key': 'probedThickness', 'factor': 100, 'attrib': {'uom': 'cm'}}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
-    # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in density profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    # Loop layers (unit conversions are done once on the whole columns)
+    data = s_p.data
+    columns = data.columns
+    depth_top = _depth_cm(data, profile_depth, 'density profile')
+    thickness, thickness_isnan = _column_scaled(data, 'thickness', 100)
+    density, _ = _column_scaled(data, 'density', 1)
+    has_uncertainty = 'uncertainty' in columns and is_v606
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(data, 'uncertainty', 1)
+    has_quality = 'quality' in columns and is_v606
+    for i, layer in enumerate(data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         attrib = {'uom': 'kgm-3'}
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-            attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
             attrib['quality'] = layer.quality
-        _ = ET.SubElement(e_layer, f'{ns}density', attrib=attrib)
-        _.text = "{:.12g}".format(layer.density)
+        _ = ET.SubElement(e_layer, tags['density'], attrib=attrib)
+        _.text = density[i]
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -826,10 +913,11 @@ def _insert_temperature_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
-    version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}tempProfile',
+    e_p = ET.SubElement(e_r, tags['tempProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -844,23 +932,23 @@ def _insert_temperature_profile(e_r, s_p, config):
              'key': 'qualityOfMeas'}, ])
 
     # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Obs')
-        _ = ET.SubElement(e_layer, f'{ns}depth', attrib={'uom': 'cm'})
-        if profile_depth - layer.height < 0:
-            raise ValueError(f'Height ({layer.height}m) > profile depth ({profile_depth}m) '
-                             'in temperature profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.height) * 100)
-        _ = ET.SubElement(e_layer, f'{ns}snowTemp', attrib={'uom': 'degC'})
-        _.text = "{:.12g}".format(layer.temperature)
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-            _ = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
-            _ = ET.SubElement(e_layer, f'{ns}qualityOfMeas')
+    columns = s_p.data.columns
+    depth = _depth_cm(s_p.data, profile_depth, 'temperature profile', key='height', label='Height')
+    temperature, _ = _column_scaled(s_p.data, 'temperature', 1)
+    for i, layer in enumerate(s_p.data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Obs'])
+        _ = ET.SubElement(e_layer, tags['depth'], attrib={'uom': 'cm'})
+        _.text = depth[i]
+        _ = ET.SubElement(e_layer, tags['snowTemp'], attrib={'uom': 'degC'})
+        _.text = temperature[i]
+        if 'uncertainty' in columns and not np.isnan(layer.uncertainty) and is_v606:
+            _ = format(layer.uncertainty, '.12g')
+        if 'quality' in columns and layer.quality is not None and is_v606:
+            _ = ET.SubElement(e_layer, tags['qualityOfMeas'])
             _.text = layer.quality
 
-    if version >= "6.0.6" and s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+    if is_v606 and s_p.profile_nr is not None:
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
@@ -874,10 +962,12 @@ def _insert_lwc_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}lwcProfile',
+    e_p = ET.SubElement(e_r, tags['lwcProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -893,27 +983,31 @@ def _insert_lwc_profile(e_r, s_p, config):
             {'value': s_p.probed_thickness, 'key': 'probedThickness', 'factor': 100, 'attrib': {'uom': 'cm'}}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in LWC profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    columns = s_p.data.columns
+    depth_top = _depth_cm(s_p.data, profile_depth, 'LWC profile')
+    thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+    has_uncertainty = 'uncertainty' in columns and is_v606
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(s_p.data, 'uncertainty', 1)
+    has_quality = 'quality' in columns and is_v606
+    for i, layer in enumerate(s_p.data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         attrib = {'uom': '% by Vol'}
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-            attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
             attrib['quality'] = layer.quality
-        _ = ET.SubElement(e_layer, f'{ns}lwc', attrib=attrib)
-        _.text = "{:.12g}".format(layer.lwc)
+        _ = ET.SubElement(e_layer, tags['lwc'], attrib=attrib)
+        _.text = format(layer.lwc, '.12g')
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -926,10 +1020,12 @@ def _insert_strength_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}strengthProfile',
+    e_p = ET.SubElement(e_r, tags['strengthProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -946,29 +1042,33 @@ def _insert_strength_profile(e_r, s_p, config):
             {'value': s_p.probed_area, 'key': 'probedArea', 'factor': 1e4, 'attrib': {'uom': 'cm2'}}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in strength profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    columns = s_p.data.columns
+    depth_top = _depth_cm(s_p.data, profile_depth, 'strength profile')
+    thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+    has_uncertainty = 'uncertainty' in columns and is_v606
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(s_p.data, 'uncertainty', 1)
+    has_quality = 'quality' in columns and is_v606
+    for i, layer in enumerate(s_p.data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         attrib = {'uom': 'Nm-2'}
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-            attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
             attrib['quality'] = layer.quality
-        _ = ET.SubElement(e_layer, f'{ns}strengthValue', attrib=attrib)
-        _.text = "{:.12g}".format(layer.strength)
-        if 'fracture_character' in layer and layer.fracture_character is not None:
-            _ = ET.SubElement(e_layer, f'{ns}fractureCharacter')
+        _ = ET.SubElement(e_layer, tags['strengthValue'], attrib=attrib)
+        _.text = format(layer.strength, '.12g')
+        if 'fracture_character' in columns and layer.fracture_character is not None:
+            _ = ET.SubElement(e_layer, tags['fractureCharacter'])
             _.text = layer.fracture_character
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
@@ -983,10 +1083,12 @@ def _insert_impurity_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}impurityProfile',
+    e_p = ET.SubElement(e_r, tags['impurityProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -1011,33 +1113,49 @@ def _insert_impurity_profile(e_r, s_p, config):
              'min_version': '6.0.6', 'comment_title': 'Probe thickness (cm3)'}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
-    # Loop layers
-    for _, layer in s_p.data.iterrows():
-        if (('mass_fraction' in layer and not np.isnan(layer.mass_fraction)) or
-            ('volume_fraction' in layer and not np.isnan(layer.volume_fraction))):
-            e_layer = ET.SubElement(e_p, f'{ns}Layer')
-            _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-            if profile_depth - layer.top_height < 0:
-                raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                                 'in impurity profile)')
-            _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-            if not np.isnan(layer.thickness):
-                _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-                _.text = "{:.12g}".format(layer.thickness * 100)
-            attrib = {'uom': '%'}
-            if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-                attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-            if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
-                attrib['quality'] = layer.quality
-            if 'mass_fraction' in layer and not np.isnan(layer.mass_fraction):
-                _ = ET.SubElement(e_layer, f'{ns}massFraction', attrib=attrib)
-                _.text = "{:.12g}".format(layer.mass_fraction)
-            else:
-                _ = ET.SubElement(e_layer, f'{ns}volumeFraction', attrib=attrib)
-                _.text = "{:.12g}".format(layer.volume_fraction)
+    # Loop layers (only the layers with a mass or a volume fraction are written)
+    data = s_p.data
+    columns = data.columns
+    has_mass_fraction = 'mass_fraction' in columns
+    has_volume_fraction = 'volume_fraction' in columns
+    written = np.zeros(len(data), dtype=bool)
+    if has_mass_fraction:
+        written |= ~np.isnan(data['mass_fraction'].to_numpy(dtype='float'))
+    if has_volume_fraction:
+        written |= ~np.isnan(data['volume_fraction'].to_numpy(dtype='float'))
+    data = data[written]
+
+    depth_top = _depth_cm(data, profile_depth, 'impurity profile')
+    thickness, thickness_isnan = _column_scaled(data, 'thickness', 100)
+    if has_mass_fraction:
+        mass_fraction, mass_fraction_isnan = _column_scaled(data, 'mass_fraction', 1)
+    if has_volume_fraction:
+        volume_fraction, _ = _column_scaled(data, 'volume_fraction', 1)
+    has_uncertainty = 'uncertainty' in columns and is_v606
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(data, 'uncertainty', 1)
+    has_quality = 'quality' in columns and is_v606
+    for i, layer in enumerate(data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
+        attrib = {'uom': '%'}
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
+            attrib['quality'] = layer.quality
+        if has_mass_fraction and not mass_fraction_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['massFraction'], attrib=attrib)
+            _.text = mass_fraction[i]
+        else:
+            _ = ET.SubElement(e_layer, tags['volumeFraction'], attrib=attrib)
+            _.text = volume_fraction[i]
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -1047,15 +1165,17 @@ def _insert_otherscalar_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     print('Profile depth in ScalarProfile', profile_depth)
     version = config['version']
+    is_v606 = config['is_v606']
 
-    if version < '6.0.6':
+    if not is_v606:
         logging.warning(f'Other scalar profile not stored in CAAML XML v{version}.')
         return
 
-    e_p = ET.SubElement(e_r, f'{ns}otherScalarProfile',
+    e_p = ET.SubElement(e_r, tags['otherScalarProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -1069,27 +1189,31 @@ def _insert_otherscalar_profile(e_r, s_p, config):
             {'value': s_p.quality_of_measurement, 'key': 'qualityOfMeas'}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in other scalar profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    columns = s_p.data.columns
+    depth_top = _depth_cm(s_p.data, profile_depth, 'other scalar profile')
+    thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+    has_uncertainty = 'uncertainty' in columns
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(s_p.data, 'uncertainty', 1)
+    has_quality = 'quality' in columns
+    for i, layer in enumerate(s_p.data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         attrib = {}
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty):
-            attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None:
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
             attrib['quality'] = layer.quality
-        _ = ET.SubElement(e_layer, f'{ns}value', attrib=attrib)
-        _.text = "{:.12g}".format(layer.data)
+        _ = ET.SubElement(e_layer, tags['value'], attrib=attrib)
+        _.text = format(layer.data, '.12g')
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -1099,14 +1223,16 @@ def _insert_othervectorial_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    if version < '6.0.6':
+    if not is_v606:
         logging.warning(f'Other vectorial profile not stored in CAAML XML v{version}.')
         return
 
-    e_p = ET.SubElement(e_r, f'{ns}otherVectorialProfile',
+    e_p = ET.SubElement(e_r, tags['otherVectorialProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -1121,27 +1247,31 @@ def _insert_othervectorial_profile(e_r, s_p, config):
             {'value': s_p.quality_of_measurement, 'key': 'qualityOfMeas'}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
-    for _, layer in s_p.data.iterrows():
-        e_layer = ET.SubElement(e_p, f'{ns}Layer')
-        _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-        if profile_depth - layer.top_height < 0:
-            raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                             'in vectorial profile)')
-        _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-        if not np.isnan(layer.thickness):
-            _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-            _.text = "{:.12g}".format(layer.thickness * 100)
+    columns = s_p.data.columns
+    depth_top = _depth_cm(s_p.data, profile_depth, 'vectorial profile')
+    thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+    has_uncertainty = 'uncertainty' in columns
+    if has_uncertainty:
+        uncertainty, uncertainty_isnan = _column_scaled(s_p.data, 'uncertainty', 1)
+    has_quality = 'quality' in columns
+    for i, layer in enumerate(s_p.data.itertuples(index=False)):
+        e_layer = ET.SubElement(e_p, tags['Layer'])
+        _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+        _.text = depth_top[i]
+        if not thickness_isnan[i]:
+            _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+            _.text = thickness[i]
         attrib = {}
-        if 'uncertainty' in layer and not np.isnan(layer.uncertainty):
-            attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-        if 'quality' in layer and layer.quality is not None:
+        if has_uncertainty and not uncertainty_isnan[i]:
+            attrib['uncertainty'] = uncertainty[i]
+        if has_quality and layer.quality is not None:
             attrib['quality'] = layer.quality
-        _ = ET.SubElement(e_layer, f'{ns}value', attrib=attrib)
-        _.text = ' '.join(["{:.12g}".format(e) for e in layer.data])
+        _ = ET.SubElement(e_layer, tags['value'], attrib=attrib)
+        _.text = ' '.join([format(e, '.12g') for e in layer.data])
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -1154,10 +1284,12 @@ def _insert_ssa_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
+    is_v606 = config['is_v606']
 
-    e_p = ET.SubElement(e_r, f'{ns}specSurfAreaProfile',
+    e_p = ET.SubElement(e_r, tags['specSurfAreaProfile'],
                         attrib=_gen_common_attrib(s_p, config=config))
 
     e_md = _gen_common_metadata(
@@ -1173,47 +1305,46 @@ def _insert_ssa_profile(e_r, s_p, config):
             {'value': s_p.probed_thickness, 'key': 'probedThickness', 'factor': 100, 'attrib': {'uom': 'cm'}}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
     import snowprofile.profiles
     if isinstance(s_p, snowprofile.profiles.SSAProfile):
-        for _, layer in s_p.data.iterrows():
-            e_layer = ET.SubElement(e_p, f'{ns}Layer')
-            _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-            if profile_depth - layer.top_height < 0:
-                raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                                 'in SSA profile)')
-            _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-            if not np.isnan(layer.thickness):
-                _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-                _.text = "{:.12g}".format(layer.thickness * 100)
+        columns = s_p.data.columns
+        depth_top = _depth_cm(s_p.data, profile_depth, 'SSA profile')
+        thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+        has_uncertainty = 'uncertainty' in columns and is_v606
+        if has_uncertainty:
+            uncertainty, uncertainty_isnan = _column_scaled(s_p.data, 'uncertainty', 1)
+        has_quality = 'quality' in columns and is_v606
+        for i, layer in enumerate(s_p.data.itertuples(index=False)):
+            e_layer = ET.SubElement(e_p, tags['Layer'])
+            _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+            _.text = depth_top[i]
+            if not thickness_isnan[i]:
+                _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+                _.text = thickness[i]
             attrib = {'uom': 'm2kg-1'}
-            if 'uncertainty' in layer and not np.isnan(layer.uncertainty) and version >= '6.0.6':
-                attrib['uncertainty'] = "{:.12g}".format(layer.uncertainty)
-            if 'quality' in layer and layer.quality is not None and version >= '6.0.6':
+            if has_uncertainty and not uncertainty_isnan[i]:
+                attrib['uncertainty'] = uncertainty[i]
+            if has_quality and layer.quality is not None:
                 attrib['quality'] = layer.quality
-            _ = ET.SubElement(e_layer, f'{ns}specSurfArea', attrib=attrib)
-            _.text = "{:.12g}".format(layer.ssa)
+            _ = ET.SubElement(e_layer, tags['specSurfArea'], attrib=attrib)
+            _.text = format(layer.ssa, '.12g')
     elif isinstance(s_p, snowprofile.profiles.SSAPointProfile):
-        e_mc = ET.SubElement(e_p, f'{ns}MeasurementComponents', attrib={
+        e_mc = ET.SubElement(e_p, tags['MeasurementComponents'], attrib={
             'uomDepth': 'cm',
             'uomSpecSurfArea': 'm2kg-1'})
-        _ = ET.SubElement(e_mc, f'{ns}depth')
+        _ = ET.SubElement(e_mc, tags['depth'])
         _.text = 'template'
-        _ = ET.SubElement(e_mc, f'{ns}specSurfArea')
+        _ = ET.SubElement(e_mc, tags['specSurfArea'])
         _.text = 'template'
-        e_m = ET.SubElement(e_p, f'{ns}Measurements')
-        e_m = ET.SubElement(e_m, f'{ns}tupleList')
-        tl = []
-        for _, layer in s_p.data.iterrows():
-            if profile_depth - layer.height < 0:
-                raise ValueError(f'Top height ({layer.height}m) > profile depth ({profile_depth}m) '
-                                 'in SSA profile)')
-            _depth = (profile_depth - layer.height) * 100
-            tl.append(f'{_depth:.12g},{layer.ssa:.12g}')
-        e_m.text = ' '.join(tl)
+        e_m = ET.SubElement(e_p, tags['Measurements'])
+        e_m = ET.SubElement(e_m, tags['tupleList'])
+        depth = _depth_cm(s_p.data, profile_depth, 'SSA profile', key='height')
+        values, _ = _column_scaled(s_p.data, 'ssa', 1)
+        e_m.text = ' '.join([f'{d},{v}' for d, v in zip(depth, values)])
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -1226,10 +1357,11 @@ def _insert_hardness_profile(e_r, s_p, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = s_p.profile_depth if s_p.profile_depth is not None else config['profile_depth']
     version = config['version']
 
-    e_p = ET.SubElement(e_r, f'{ns}hardnessProfile',
+    e_p = ET.SubElement(e_r, tags['hardnessProfile'],
                         attrib={
                             'uomWeightHammer': 'kg',
                             'uomWeightTube': 'kg',
@@ -1252,55 +1384,49 @@ def _insert_hardness_profile(e_r, s_p, config):
              'min_version': '6.0.6', 'comment_title': 'Penetration speed'}, ])
 
     if s_p.profile_nr is not None:
-        _ = ET.SubElement(e_p, f'{ns}profileNr')
+        _ = ET.SubElement(e_p, tags['profileNr'])
         _.text = str(s_p.profile_nr)
 
     # Loop layers
     import snowprofile.profiles
     if isinstance(s_p, snowprofile.profiles.HardnessProfile):
-        for _, layer in s_p.data.iterrows():
-            e_layer = ET.SubElement(e_p, f'{ns}Layer')
-            _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-            if profile_depth - layer.top_height < 0:
-                raise ValueError(f'Top height ({layer.top_height}m) > profile depth ({profile_depth}m) '
-                                 'in hardness profile)')
-            _.text = "{:.12g}".format((profile_depth - layer.top_height) * 100)
-            if not np.isnan(layer.thickness):
-                _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-                _.text = "{:.12g}".format(layer.thickness * 100)
+        columns = s_p.data.columns
+        depth_top = _depth_cm(s_p.data, profile_depth, 'hardness profile')
+        thickness, thickness_isnan = _column_scaled(s_p.data, 'thickness', 100)
+        # Optional ram sonde columns: (tag, (formatted values, nan mask))
+        optional = [(tag, _column_scaled(s_p.data, key, factor))
+                    for key, tag, factor in [('weight_hammer', 'weightHammer', 1),
+                                             ('weight_tube', 'weightTube', 1),
+                                             ('n_drops', 'nDrops', 1),
+                                             ('drop_height', 'dropHeight', 100)]
+                    if key in columns]
+        for i, layer in enumerate(s_p.data.itertuples(index=False)):
+            e_layer = ET.SubElement(e_p, tags['Layer'])
+            _ = ET.SubElement(e_layer, tags['depthTop'], attrib={'uom': 'cm'})
+            _.text = depth_top[i]
+            if not thickness_isnan[i]:
+                _ = ET.SubElement(e_layer, tags['thickness'], attrib={'uom': 'cm'})
+                _.text = thickness[i]
             attrib = {'uom': 'N'}
-            _ = ET.SubElement(e_layer, f'{ns}hardness', attrib=attrib)
-            _.text = "{:.12g}".format(layer.hardness)
-            if 'weight_hammer' in layer and not np.isnan(layer.weight_hammer):
-                _ = ET.SubElement(e_layer, f'{ns}weightHammer')
-                _.text = "{:.12g}".format(layer.weight_hammer)
-            if 'weight_tube' in layer and not np.isnan(layer.weight_tube):
-                _ = ET.SubElement(e_layer, f'{ns}weightTube')
-                _.text = "{:.12g}".format(layer.weight_tube)
-            if 'n_drops' in layer and not np.isnan(layer.n_drops):
-                _ = ET.SubElement(e_layer, f'{ns}nDrops')
-                _.text = "{:.12g}".format(layer.n_drops)
-            if 'drop_height' in layer and not np.isnan(layer.drop_height):
-                _ = ET.SubElement(e_layer, f'{ns}dropHeight')
-                _.text = "{:.12g}".format(layer.drop_height * 100)
+            _ = ET.SubElement(e_layer, tags['hardness'], attrib=attrib)
+            _.text = format(layer.hardness, '.12g')
+            for tag, (values, isnan) in optional:
+                if not isnan[i]:
+                    _ = ET.SubElement(e_layer, tags[tag])
+                    _.text = values[i]
     elif isinstance(s_p, snowprofile.profiles.HardnessPointProfile):
-        e_mc = ET.SubElement(e_p, f'{ns}MeasurementComponents', attrib={
+        e_mc = ET.SubElement(e_p, tags['MeasurementComponents'], attrib={
             'uomDepth': 'cm',
             'uomHardness': 'N'})
-        _ = ET.SubElement(e_mc, f'{ns}depth')
+        _ = ET.SubElement(e_mc, tags['depth'])
         _.text = 'template'
-        _ = ET.SubElement(e_mc, f'{ns}penRes')
+        _ = ET.SubElement(e_mc, tags['penRes'])
         _.text = 'template'
-        e_m = ET.SubElement(e_p, f'{ns}Measurements')
-        e_m = ET.SubElement(e_m, f'{ns}tupleList')
-        tl = []
-        for _, layer in s_p.data.iterrows():
-            if profile_depth - layer.height < 0:
-                raise ValueError(f'Top height ({layer.height}m) > profile depth ({profile_depth}m) '
-                                 'in hardness profile)')
-            _depth = (profile_depth - layer.height) * 100
-            tl.append(f'{_depth:.12g},{layer.hardness:.12g}')
-        e_m.text = ' '.join(tl)
+        e_m = ET.SubElement(e_p, tags['Measurements'])
+        e_m = ET.SubElement(e_m, tags['tupleList'])
+        depth = _depth_cm(s_p.data, profile_depth, 'hardness profile', key='height')
+        values, _ = _column_scaled(s_p.data, 'hardness', 1)
+        e_m.text = ' '.join([f'{d},{v}' for d, v in zip(depth, values)])
 
     _append_additional_data(e_p, s_p.additional_data, ns=ns)
 
@@ -1310,44 +1436,45 @@ def _insert_stb_test(e_r, s_t, config):
         return
 
     ns = config['ns']
+    tags = config['tags']
     profile_depth = config['profile_depth']
 
     import snowprofile.stability_tests
 
     if isinstance(s_t, snowprofile.stability_tests.CTStabilityTest):
-        e_t = ET.SubElement(e_r, f'{ns}ComprTest',
+        e_t = ET.SubElement(e_r, tags['ComprTest'],
                             attrib=_gen_common_attrib(s_t, config=config))
         _stb_test_common(e_t, s_t, config=config)
 
         if len(s_t.results) == 0:  # No failure
-            _ = ET.SubElement(e_t, f'{ns}noFailure')
+            _ = ET.SubElement(e_t, tags['noFailure'])
         else:  # Positive result(s)
             for result in s_t.results:
-                e_fail = ET.SubElement(e_t, f'{ns}failedOn')
+                e_fail = ET.SubElement(e_t, tags['failedOn'])
                 # Failure layer details
                 _stb_test_layer_details(e_fail, result, ns=ns, profile_depth=profile_depth)
                 # CT result
-                e_resu = ET.SubElement(e_fail, f'{ns}Results')
+                e_resu = ET.SubElement(e_fail, tags['Results'])
                 if result.fracture_character is not None:
-                    _ = ET.SubElement(e_resu, f'{ns}fractureCharacter')
+                    _ = ET.SubElement(e_resu, tags['fractureCharacter'])
                     _.text = result.fracture_character
-                _ = ET.SubElement(e_resu, f'{ns}testScore')
+                _ = ET.SubElement(e_resu, tags['testScore'])
                 _.text = '{:d}'.format(result.test_score)
     elif isinstance(s_t, snowprofile.stability_tests.ECTStabilityTest):
-        e_t = ET.SubElement(e_r, f'{ns}ExtColumnTest',
+        e_t = ET.SubElement(e_r, tags['ExtColumnTest'],
                             attrib=_gen_common_attrib(s_t, config=config))
         _stb_test_common(e_t, s_t, config=config)
 
         if len(s_t.results) == 0:  # No failure
-            _ = ET.SubElement(e_t, f'{ns}noFailure')
+            _ = ET.SubElement(e_t, tags['noFailure'])
         else:  # Positive result(s)
             for result in s_t.results:
-                e_fail = ET.SubElement(e_t, f'{ns}failedOn')
+                e_fail = ET.SubElement(e_t, tags['failedOn'])
                 # Failure layer details
                 _stb_test_layer_details(e_fail, result, ns=ns, profile_depth=profile_depth)
                 # ECT result
-                e_resu = ET.SubElement(e_fail, f'{ns}Results')
-                _ = ET.SubElement(e_resu, f'{ns}testScore')
+                e_resu = ET.SubElement(e_fail, tags['Results'])
+                _ = ET.SubElement(e_resu, tags['testScore'])
                 if result.test_score == 0 and result.propagation:
                     _.text = 'ECTPV'
                 elif result.test_score == 0:
@@ -1355,65 +1482,63 @@ def _insert_stb_test(e_r, s_t, config):
                 else:
                     _.text = 'ECT{p}{n}'.format(p = 'P' if result.propagation else 'N', n = result.test_score)
     elif isinstance(s_t, snowprofile.stability_tests.RBStabilityTest):
-        e_t = ET.SubElement(e_r, f'{ns}RBlockTest',
+        e_t = ET.SubElement(e_r, tags['RBlockTest'],
                             attrib=_gen_common_attrib(s_t, config=config))
         _stb_test_common(e_t, s_t, config=config)
 
         if len(s_t.results) == 0:  # No failure
-            _ = ET.SubElement(e_t, f'{ns}noFailure')
+            _ = ET.SubElement(e_t, tags['noFailure'])
         else:  # Positive result(s)
             for result in s_t.results:
-                e_fail = ET.SubElement(e_t, f'{ns}failedOn')
+                e_fail = ET.SubElement(e_t, tags['failedOn'])
                 # Failure layer details
                 _stb_test_layer_details(e_fail, result, ns=ns, profile_depth=profile_depth)
                 # RB result
-                e_resu = ET.SubElement(e_fail, f'{ns}Results')
+                e_resu = ET.SubElement(e_fail, tags['Results'])
                 if result.fracture_character is not None:
-                    _ = ET.SubElement(e_resu, f'{ns}fractureCharacter')
+                    _ = ET.SubElement(e_resu, tags['fractureCharacter'])
                     _.text = result.fracture_character
                 if result.release_type is not None:
-                    _ = ET.SubElement(e_resu, f'{ns}releaseType')
+                    _ = ET.SubElement(e_resu, tags['releaseType'])
                     _.text = result.release_type
-                _ = ET.SubElement(e_resu, f'{ns}testScore')
+                _ = ET.SubElement(e_resu, tags['testScore'])
                 _.text = f'RB{result.test_score}'
     elif isinstance(s_t, snowprofile.stability_tests.ShearFrameStabilityTest):
-        e_t = ET.SubElement(e_r, f'{ns}ShearFrameTest',
+        e_t = ET.SubElement(e_r, tags['ShearFrameTest'],
                             attrib=_gen_common_attrib(s_t, config=config))
         _stb_test_common(e_t, s_t, config=config)
 
         if len(s_t.results) == 0:  # No failure
-            _ = ET.SubElement(e_t, f'{ns}noFailure')
+            _ = ET.SubElement(e_t, tags['noFailure'])
         else:  # Positive result(s)
             for result in s_t.results:
-                e_fail = ET.SubElement(e_t, f'{ns}failedOn')
+                e_fail = ET.SubElement(e_t, tags['failedOn'])
                 # Failure layer details
                 _stb_test_layer_details(e_fail, result, ns=ns, profile_depth=profile_depth)
                 # SF result
-                e_resu = ET.SubElement(e_fail, f'{ns}Results')
+                e_resu = ET.SubElement(e_fail, tags['Results'])
                 if result.fracture_character is not None:
-                    _ = ET.SubElement(e_resu, f'{ns}fractureCharacter')
+                    _ = ET.SubElement(e_resu, tags['fractureCharacter'])
                     _.text = result.fracture_character
-                _ = ET.SubElement(e_resu, f'{ns}failureForce', attrib={'uom': 'N'})
-                _.text = "{:.12g}".format(result.force)
+                _add_scalar(e_resu, tags['failureForce'], result.force, uom='N')
     elif isinstance(s_t, snowprofile.stability_tests.PSTStabilityTest):
-        e_t = ET.SubElement(e_r, f'{ns}PropSawTest',
+        e_t = ET.SubElement(e_r, tags['PropSawTest'],
                             attrib=_gen_common_attrib(s_t, config=config))
         _stb_test_common(e_t, s_t, config=config)
-        e_t = ET.SubElement(e_t, f'{ns}failedOn')
+        e_t = ET.SubElement(e_t, tags['failedOn'])
 
         # Failure layer details
         _stb_test_layer_details(e_t, s_t, ns=ns, profile_depth=profile_depth)
         # ECT result
-        e_resu = ET.SubElement(e_t, f'{ns}Results')
-        _ = ET.SubElement(e_resu, f'{ns}fracturePropagation')
+        e_resu = ET.SubElement(e_t, tags['Results'])
+        _ = ET.SubElement(e_resu, tags['fracturePropagation'])
         _.text = s_t.propagation
-        _ = ET.SubElement(e_resu, f'{ns}cutLength', attrib={'uom': 'cm'})
-        _.text = "{:.12g}".format(s_t.cut_length * 100)
-        _ = ET.SubElement(e_resu, f'{ns}columnLength', attrib={'uom': 'cm'})
+        _add_scalar(e_resu, tags['cutLength'], s_t.cut_length, uom='cm', factor=100)
+        _ = ET.SubElement(e_resu, tags['columnLength'], attrib={'uom': 'cm'})
         if s_t.column_length is None:
             _.text = "150"
         else:
-            _.text = "{:.12g}".format(s_t.column_length * 100)
+            _.text = format(s_t.column_length * 100, '.12g')
     else:
         raise ValueError(f'Unknown stability test type {type(s_t)}.')
 
@@ -1421,11 +1546,9 @@ def _insert_stb_test(e_r, s_t, config):
 def _stb_test_common(e_t, s_t, config={'ns': ''}):
     ns = config['ns']
     if s_t.comment is not None:
-        _ = ET.SubElement(e_t, f'{ns}metaData')
-        _ = ET.SubElement(_, f'{ns}comment')
-        _.text = s_t.comment
+        _add_meta_comment(e_t, s_t.comment, ns=ns)
 
-    if s_t.test_nr is not None and config['version'] >= '6.0.6':
+    if s_t.test_nr is not None and config['is_v606']:
         _ = ET.SubElement(e_t, f'{ns}testNr')
         _.text = str(s_t.test_nr)
 
@@ -1440,11 +1563,10 @@ def _stb_test_layer_details(e_fail, result, ns='', profile_depth=0):
         _.text = str(result.layer_comment)
 
     _ = ET.SubElement(e_layer, f'{ns}depthTop', attrib={'uom': 'cm'})
-    _.text = "{:.12g}".format((profile_depth - result.height) * 100)
+    _.text = format((profile_depth - result.height) * 100, '.12g')
 
     if result.layer_thickness is not None:
-        _ = ET.SubElement(e_layer, f'{ns}thickness', attrib={'uom': 'cm'})
-        _.text = "{:.12g}".format(result.layer_thickness * 100)
+        _add_scalar(e_layer, f'{ns}thickness', result.layer_thickness, uom='cm', factor=100)
 
     if result.grain_1 is not None:
         _ = ET.SubElement(e_layer, f'{ns}grainFormPrimary')
@@ -1458,10 +1580,10 @@ def _stb_test_layer_details(e_fail, result, ns='', profile_depth=0):
         _ = ET.SubElement(e_layer, f'{ns}grainSize', attrib={'uom': 'mm'})
         _c = ET.SubElement(_, f'{ns}Components')
         _ = ET.SubElement(_c, f'{ns}avg')
-        _.text = "{:.12g}".format(result.grain_size * 1e3)
+        _.text = format(result.grain_size * 1e3, '.12g')
         if result.grain_size_max is not None:
             _ = ET.SubElement(_c, f'{ns}avgMax')
-            _.text = "{:.12g}".format(result.grain_size_max * 1e3)
+            _.text = format(result.grain_size_max * 1e3, '.12g')
     _md = None
 
     if result.layer_formation_time is not None:
@@ -2,31 +2,109 @@
 
 import re
 import logging
+import functools
 import xml.etree.ElementTree as ET
 
+_re_simple_path = re.compile(r'(?:{[^}]*})?[\w-]+(?:/(?:{[^}]*})?[\w-]+)*$')
+_re_path_step = re.compile(r'(?:{[^}]*})?[\w-]+')
 
-def _parse_str(root, path, clean=True, attribute=None, attribution_table=None):
+
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path):
     """
-    Search for an element described by path in the XML Element root
-    and parse its content as a string.
+    Split a path made only of (possibly namespaced) child tags into its steps.
+
+    ElementPath keeps at most 100 compiled paths and the reader uses more than
+    that per file, so its cache is cleared over and over. Plain tags are
+    searched directly by the C implementation of Element.find and findall.
+
+    :param path: ElementPath expression
+    :returns: Tuple of tags or None if the path uses any other ElementPath syntax
+    """
+    if _re_simple_path.match(path) is None:
+        return None
+    return tuple(_re_path_step.findall(path))
+
+
+def _findall(root, path):
+    """
+    Equivalent of root.findall(path) using the cached path steps when possible.
 
     :param root: A XML Element (or None)
-    :param path: Path to the searched data (str or list, in case this is a list, take the first non-void element)
-    :param clean: Apply strip() on the resulting string
-    :param attribute: Parse the content of an attribute of the given element rather than the text content.
-    :returns: Parsed string or None if not found
+    :param path: Path to the searched elements
+    :returns: List of XML elements
+    """
+    if root is None:
+        return []
+    steps = _compile_path(path)
+    if steps is None:
+        return root.findall(path)
+    nodes = [root]
+    for tag in steps:
+        nodes = [c for n in nodes for c in n.findall(tag)]
+    return nodes
+
+
+def _find_steps(nodes, steps):
+    """
+    Search the first element matching the tags steps below any of the XML elements nodes.
+
+    :param nodes: List of XML Elements
+    :param steps: Tuple of tags, as returned by _compile_path
+    :returns: The XML element or None if not found
+    """
+    for tag in steps[:-1]:
+        nodes = [c for n in nodes for c in n.findall(tag)]
+    last = steps[-1]
+    for n in nodes:
+        f = n.find(last)
+        if f is not None:
+            return f
+    return None
+
+
+def _find(root, path):
+    """
+    Equivalent of root.find(path) using the cached path steps when possible.
+
+    :param root: A XML Element (or None)
+    :param path: Path to the searched element
+    :returns: The XML element or None if not found
     """
     if root is None:
         return None
+    steps = _compile_path(path)
+    if steps is None or len(steps) == 1:
+        return root.find(path)
+    return _find_steps([root], steps)
 
-    if isinstance(path, list):
-        for p in path:
-            f = root.find(p)
-            if f is not None:
-                break
-    else:
-        f = root.find(path)
 
+def _find_first(root, path):
+    """
+    Find the element described by path in the XML Element root.
+
+    :param root: A XML Element
+    :param path: Path to the searched element (str or list, in case this is a list, take the first element found)
+    :returns: The XML element or None if not found
+    """
+    if isinstance(path, str):
+        return _find(root, path)
+    for p in path:
+        f = _find(root, p)
+        if f is not None:
+            return f
+    return None
+
+
+def _element_str(f, clean=True, attribute=None, attribution_table=None):
+    """
+    Parse the content of the XML element f as a string.
+
+    :param f: A XML Element (or None)
+    :param clean: Apply strip() on the resulting string
+    :param attribute: Parse the content of an attribute of the given element rather than the text content.
+    :returns: Parsed string or None if not found
+    """
     if f is not None:
         if attribute is None:
             r = f.text
@@ -45,49 +123,36 @@ def _parse_str(root, path, clean=True, attribute=None, attribution_table=None):
         return r
 
 
-def _parse_numeric(root, path, factor=1, attribute=None, attribution_table=None):
+def _element_numeric(f, factor=1, attribute=None, attribution_table=None):
     """
-    Search for an element described by path in the XML Element root
-    and parse its content as a floating-point number.
+    Parse the content of the XML element f as a floating-point number.
 
-    :param root: A XML Element (or None)
-    :param path: Path to the searched data
+    :param f: A XML Element (or None)
     :param factor: A factor to apply to the parsed float
     :param attribute: Parse the content of an attribute of the given element rather than the text content.
     :returns: Parsed float or None if not found
     """
-    f = _parse_str(root, path, attribute=attribute, attribution_table=attribution_table)
+    f = _element_str(f, attribute=attribute, attribution_table=attribution_table)
 
     if f is not None:
         try:
             f = float(f)
-            return f * factor
+            if factor != 1:
+                f = f * factor
+            return f
         except Exception:
             return None
 
 
-def _parse_numeric_list(root, path, factor=1, attribute=None):
+def _element_numeric_list(f, factor=1, attribute=None):
     """
-    Search for an element described by path in the XML Element root
-    and parse its content as a list of floating-point number.
+    Parse the content of the XML element f as a list of floating-point number.
 
-    :param root: A XML Element (or None)
-    :param path: Path to the searched data
+    :param f: A XML Element (or None)
     :param factor: A factor to apply to the parsed float
     :param attribute: Parse the content of an attribute of the given element rather than the text content.
     :returns: Parsed list of float or None if not found
     """
-    if root is None:
-        return None
-
-    if isinstance(path, list):
-        for p in path:
-            f = root.find(p)
-            if f is not None:
-                break
-    else:
-        f = root.find(path)
-
     if f is not None:
         if attribute is None:
             r = f.text.strip()
@@ -97,19 +162,72 @@ def _parse_numeric_list(root, path, factor=1, attribute=None):
             else:
                 return None
         try:
-            fl = r.split()
-            rl = [float(x) * factor for x in fl]
-            return rl
+            rl = [float(x) for x in r.split()]
         except Exception:
             return None
+        if factor != 1:
+            rl = [x * factor for x in rl]
+        return rl
+
+
+def _parse_str(root, path, clean=True, attribute=None, attribution_table=None):
+    """
+    Search for an element described by path in the XML Element root
+    and parse its content as a string.
+
+    :param root: A XML Element (or None)
+    :param path: Path to the searched data (str or list, in case this is a list, take the first non-void element)
+    :param clean: Apply strip() on the resulting string
+    :param attribute: Parse the content of an attribute of the given element rather than the text content.
+    :returns: Parsed string or None if not found
+    """
+    if root is None:
+        return None
+
+    return _element_str(_find_first(root, path), clean=clean, attribute=attribute,
+                        attribution_table=attribution_table)
+
+
+def _parse_numeric(root, path, factor=1, attribute=None, attribution_table=None):
+    """
+    Search for an element described by path in the XML Element root
+    and parse its content as a floating-point number.
+
+    :param root: A XML Element (or None)
+    :param path: Path to the searched data
+    :param factor: A factor to apply to the parsed float
+    :param attribute: Parse the content of an attribute of the given element rather than the text content.
+    :returns: Parsed float or None if not found
+    """
+    if root is None:
+        return None
+
+    return _element_numeric(_find_first(root, path), factor=factor, attribute=attribute,
+                            attribution_table=attribution_table)
+
+
+def _parse_numeric_list(root, path, factor=1, attribute=None):
+    """
+    Search for an element described by path in the XML Element root
+    and parse its content as a list of floating-point number.
+
+    :param root: A XML Element (or None)
+    :param path: Path to the searched data
+    :param factor: A factor to apply to the parsed float
+    :param attribute: Parse the content of an attribute of the given element rather than the text content.
+    :returns: Parsed list of float or None if not found
+    """
+    if root is None:
+        return None
+
+    return _element_numeric_list(_find_first(root, path), factor=factor, attribute=attribute)
 
 
 def _search_gml_id(element):
     if element is None:
         return None
     for key, value in element.attrib.items():
-        r = re.match('{.*}id$', key)
-        if r is not None or key == 'id':
+        if key == 'id' or (key.endswith('}id') and key[0] == '{'):
             return value
 
 
@@ -117,14 +235,12 @@ def _parse_lat_lon(pointlocation):
     if pointlocation is None:
         return None, None
     for elem in pointlocation:
-        r = re.match('{.*}Point$', elem.tag)
-        if r is not None or elem.tag == 'Point':
+        if elem.tag == 'Point' or (elem.tag.endswith('}Point') and elem.tag[0] == '{'):
             for e in elem:
-                r = re.match('{.*}pos$', e.tag)
-                if r is not None or e.tag == 'pos':
+                if e.tag == 'pos' or (e.tag.endswith('}pos') and e.tag[0] == '{'):
                     try:
-                        sp = e.text.strip().split()
-                        return float(sp[0]), float(sp[1])
+                        lat, lon = e.text.split(None, 2)[:2]
+                        return float(lat), float(lon)
                     except Exception:
                         logging.warning('Could not parse latitude/longitude')
 
@@ -142,8 +258,6 @@ def _parse_list(*args, **kwargs):
 
 def _parse_additional_data(ad_element, origin='caamlxml6'):
     if ad_element is not None:
-        data = ''
-        for e in ad_element:
-            data += ET.tostring(e, encoding='utf-8').decode('utf-8')
+        data = ''.join([ET.tostring(e, encoding='unicode') for e in ad_element])
         return {'data': data, 'origin': origin}
     return None
@@ -134,15 +134,16 @@ class SnowProfile(pydantic.BaseModel, BaseMergeable):
 
     model_config = pydantic.ConfigDict(
         validate_assignment=True,
-        extra='forbid')
+        extra='forbid',
+        defer_build=True)
 
     id: typing.Optional[str] = None
     comment: typing.Optional[str] = None
     profile_comment: typing.Optional[str] = None
-    time: Time = Time()
-    observer: Observer = Observer()
-    location: Location = Location(name='Unknown')
-    environment: Environment = Environment()
+    time: Time = pydantic.Field(default_factory=Time)
+    observer: Observer = pydantic.Field(default_factory=Observer)
+    location: Location = pydantic.Field(default_factory=lambda: Location(name='Unknown'))
+    environment: Environment = pydantic.Field(default_factory=Environment)
     application: typing.Optional[str] = 'snowprofile'
     application_version: typing.Optional[str] = None
     profile_depth: typing.Optional[float] = pydantic.Field(None, ge=0)
@@ -159,19 +160,20 @@ class SnowProfile(pydantic.BaseModel, BaseMergeable):
         'Drifting snow',
         'Blowing snow']] = None
     snow_transport_occurence_24: typing.Optional[float] = pydantic.Field(None, ge=0, le=100)
-    weather: Weather = Weather()
-    surface_conditions: SurfaceConditions = SurfaceConditions()
+    weather: Weather = pydantic.Field(default_factory=Weather)
+    surface_conditions: SurfaceConditions = pydantic.Field(default_factory=SurfaceConditions)
     stratigraphy_profile: typing.Optional[Stratigraphy] = None
-    temperature_profiles: typing.List[TemperatureProfile] = []
-    density_profiles: typing.List[DensityProfile] = []
-    lwc_profiles: typing.List[LWCProfile] = []
-    ssa_profiles: typing.List[SSAProfile | SSAPointProfile] = []
-    hardness_profiles: typing.List[HardnessProfile | HardnessPointProfile] = []
-    strength_profiles: typing.List[StrengthProfile] = []
-    impurity_profiles: typing.List[ImpurityProfile] = []
-    other_scalar_profiles: typing.List[ScalarProfile] = []
-    other_vectorial_profiles: typing.List[VectorialProfile] = []
+    temperature_profiles: typing.List[TemperatureProfile] = pydantic.Field(default_factory=list)
+    density_profiles: typing.List[DensityProfile] = pydantic.Field(default_factory=list)
+    lwc_profiles: typing.List[LWCProfile] = pydantic.Field(default_factory=list)
+    ssa_profiles: typing.List[SSAProfile | SSAPointProfile] = pydantic.Field(default_factory=list)
+    hardness_profiles: typing.List[HardnessProfile | HardnessPointProfile] = pydantic.Field(default_factory=list)
+    strength_profiles: typing.List[StrengthProfile] = pydantic.Field(default_factory=list)
+    impurity_profiles: typing.List[ImpurityProfile] = pydantic.Field(default_factory=list)
+    other_scalar_profiles: typing.List[ScalarProfile] = pydantic.Field(default_factory=list)
+    other_vectorial_profiles: typing.List[VectorialProfile] = pydantic.Field(default_factory=list)
     stability_tests: typing.List[
-        CTStabilityTest | ECTStabilityTest | RBStabilityTest | PSTStabilityTest | ShearFrameStabilityTest] = []
+        CTStabilityTest | ECTStabilityTest | RBStabilityTest | PSTStabilityTest | ShearFrameStabilityTest] = pydantic.Field(
+            default_factory=list)
     additional_data: typing.Optional[AdditionalData] = None
     profile_additional_data: typing.Optional[AdditionalData] = None
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from pydantic_core._pydantic_core import ValidationError
+
+import snowprofile
+
+
+class TestLocation(unittest.TestCase):
+
+    def test_country(self):
+        """
+        Check country codes are normalized to upper case
+        """
+        loc = snowprofile.classes.Location(name='Col de Porte', country='fr')
+        assert loc.country == 'FR'
+
+    def test_country_invalid(self):
+        """
+        Check invalid country codes raise a validation error
+        """
+        for value in ['XX', ['fr'], 33]:
+            with self.assertRaises(ValidationError):
+                snowprofile.classes.Location(name='Col de Porte', country=value)
+
+    def test_revalidate(self):
+        """
+        Check revalidate returns an equal new object for valid data
+        and raises for data that bypassed validation
+        """
+        loc = snowprofile.classes.Location(name='Col de Porte', country='fr', slope=30,
+                                           additional_data={'data': {'key': ['value']}})
+        loc2 = loc.revalidate()
+        assert loc2 is not loc
+        assert loc2 == loc
+        assert loc2.additional_data is not loc.additional_data
+        assert loc2.additional_data.data['key'] is not loc.additional_data.data['key']
+
+        loc = snowprofile.classes.Location.model_construct(name='Col de Porte', slope=95)
+        with self.assertRaises(ValidationError):
+            loc.revalidate()
+        assert loc.slope == 95
+
+    def test_revalidate_nested(self):
+        """
+        Check revalidate also validates nested objects and does not share them
+        """
+        sa = snowprofile.classes.SpectralAlbedo(
+            data={'min_wavelength': [400], 'max_wavelength': [500], 'albedo': [0.9]},
+            comment='Albedo')
+        sc = snowprofile.classes.SurfaceConditions(
+            spectral_albedo=sa,
+            surface_features_amplitude=0.1)
+        sc2 = sc.revalidate()
+        assert sc2.spectral_albedo is not sa
+        assert sc2.spectral_albedo.comment == 'Albedo'
+        assert sc2.spectral_albedo.data.equals(sa.data)
+        assert sc2.surface_features_amplitude == 0.1
+
+        sc = snowprofile.classes.SurfaceConditions.model_construct(
+            spectral_albedo=snowprofile.classes.SpectralAlbedo.model_construct(comment=123))
+        with self.assertRaises(ValidationError):
+            sc.revalidate()
+
+        sa_invalid = snowprofile.classes.SpectralAlbedo.model_construct(comment=123)
+        sa_invalid.__dict__['_data'] = sa.data
+        sc = snowprofile.classes.SurfaceConditions.model_construct(spectral_albedo=sa_invalid)
+        with self.assertRaises(ValidationError):
+            sc.revalidate()
+
+    def test_country_schema(self):
+        """
+        Check the accepted country codes are listed in the JSON schema
+        """
+        schema = snowprofile.classes.Location.model_json_schema()
+        assert 'FR' in schema['properties']['country']['enum']
+
+
+class TestWeather(unittest.TestCase):
+
+    def test_precipitation(self):
+        """
+        Check known precipitation codes are accepted
+        """
+        w = snowprofile.classes.Weather(precipitation='-RA')
+        assert w.precipitation == '-RA'
+
+    def test_precipitation_invalid(self):
+        """
+        Check unknown or non-str precipitation codes raise a validation error
+        """
+        for value in ['XX', ['RA'], 1]:
+            with self.assertRaises(ValidationError):
+                snowprofile.classes.Weather(precipitation=value)
+
+    def test_precipitation_schema(self):
+        """
+        Check the accepted precipitation codes are listed in the JSON schema
+        """
+        schema = snowprofile.classes.Weather.model_json_schema()
+        assert 'RA' in schema['properties']['precipitation']['enum']
+
+
+if __name__ == "__main__":
+    unittest.main()
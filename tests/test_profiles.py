@@ -6,8 +6,10 @@ import datetime
 
 from pydantic_core._pydantic_core import ValidationError
 import numpy as np
+import pandas as pd
 
 import snowprofile
+from snowprofile._base_classes import _PANDAS_GE_3
 
 
 class BaseTestProfiles:
@@ -48,6 +50,26 @@ class BaseTestProfiles:
         # Check correctly updated
         assert (sp_pd.data['top_height'].values == np.array([2, 2])).all()
 
+    def test_data_is_a_copy(self):
+        """
+        Check that modifying the DataFrame returned by data does not modify the profile,
+        whether pandas copy-on-write mode is enabled or not.
+        """
+        sp_pd = self.CLASS(data={'top_height': [1, 2],
+                                 'thickness': [1, 1],
+                                 self.key: self.values, },
+                           **self.additional_keys)
+        modes = [None] if _PANDAS_GE_3 else [False, True]
+        for mode in modes:
+            if mode is None:
+                data = sp_pd.data
+                data.loc[data.index[0], 'top_height'] = 10
+            else:
+                with pd.option_context('mode.copy_on_write', mode):
+                    data = sp_pd.data
+                    data.loc[data.index[0], 'top_height'] = 10
+            assert (sp_pd.data_view['top_height'].values == np.array([2, 1])).all()
+
     def test_init_profile_fail(self):
         """
         check there is a fail if minimal data is not present
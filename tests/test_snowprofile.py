@@ -20,6 +20,21 @@ class TestSnowProfile(unittest.TestCase):
         sp.time.record_time = datetime.datetime(2019, 12, 25, 10, 0)
         sp.time.report_time = datetime.datetime.now()
 
+    def test_record_period_utc(self):
+        sp = snowprofile.SnowProfile()
+        import datetime
+        sp.time.record_period = (datetime.datetime(2019, 12, 25, 9, 0), '2019-12-25T10:00')
+        assert sp.time.record_period[0].tzinfo == datetime.timezone.utc
+        assert sp.time.record_period[1].tzinfo == datetime.timezone.utc
+
+    def test_record_time_default(self):
+        import datetime
+        before = datetime.datetime.now(datetime.timezone.utc)
+        t = snowprofile.classes.Time()
+        assert t.record_time.tzinfo == datetime.timezone.utc
+        assert t.record_time >= before
+        assert t.revalidate().record_time == t.record_time
+
     def test_add_profile(self):
         sp = snowprofile.SnowProfile()
         dp = snowprofile.profiles.DensityProfile(